@@ -10,6 +10,10 @@ Copyright 2016, 2021 David Kemp
 Licensed under the Apache License, Version 2.0
 http://www.apache.org/licenses/LICENSE-2.0
 """
+import copy
+import re
+import sys
+
 from typing import Any, Callable, Dict, List, Optional
 from .codec import SymbolTableField, SymbolTableFieldDefinition, enctab, _decode_maprec, _encode_maprec
 from .format_serialize_json import json_format_codecs, get_format_encode_function, get_format_decode_function
@@ -53,6 +57,7 @@ class Codec:
         # pre-index types to allow symtab forward refs
         self.types = {t.TypeName: t for t in object_types(self.schema['types'])}
         self.symtab = {}                         # Symbol table - pre-computed values for all datatypes
+        self.verbose_rec = self.verbose_str = None
         self.set_mode(verbose_rec, verbose_str)  # Create symbol table based on encoding mode
 
     def decode(self, datatype: str, sval: Any) -> Any:  # Decode serialized value into API value
@@ -69,12 +74,40 @@ class Codec:
             raise_error(f'Validation Error: Encode: datatype "{datatype}" is not defined')
         return ts.Encode(ts, aval, self)     # Dispatch to type-specific encoder
 
+    def decoder(self, datatype: str) -> Callable[[Any], Any]:  # Decode function for one datatype
+        # Resolved against the current mode, call again after set_mode
+        try:
+            ts = self.symtab[datatype]
+        except KeyError:
+            raise_error(f'Validation Error: Decode: datatype "{datatype}" is not defined')
+        dec = ts.Decode
+        return lambda sval: dec(ts, sval, self)
+
+    def encoder(self, datatype: str) -> Callable[[Any], Any]:  # Encode function for one datatype
+        # Resolved against the current mode, call again after set_mode
+        try:
+            ts = self.symtab[datatype]
+        except KeyError:
+            raise_error(f'Validation Error: Encode: datatype "{datatype}" is not defined')
+        enc = ts.Encode
+        return lambda aval: enc(ts, aval, self)
+
+    def with_mode(self, verbose_rec=False, verbose_str=False) -> 'Codec':
+        # Codec for another mode sharing this one's schema, config and format tables; only the symtab is rebuilt
+        tc = copy.copy(self)
+        tc.set_mode(verbose_rec, verbose_str)
+        return tc
+
     def set_mode(self, verbose_rec=False, verbose_str=False):
+        if (verbose_rec, verbose_str) == (self.verbose_rec, self.verbose_str):
+            return                  # Symbol table is already built for this mode
+
         # Build symbol table field entries
         def symf(fld: GenFieldDefinition, fa: int, fnames: dict) -> SymbolTableFieldDefinition:
             fo, to = ftopts_s2d(fld.FieldOptions)
             if to:
                 raise_error(f'Validation Error: {fld.FieldName}: internal error: unexpected type options: {to}')
+            fld.FieldType = sys.intern(fld.FieldType)     # Type references are symtab keys
             fopts = {'minc': 1, 'maxc': 1, **fo}
             assert fopts['minc'] in (0, 1) and fopts['maxc'] == 1     # Other cardinalities have been simplified
             ctag: Optional[int] = None
@@ -95,7 +128,9 @@ class Codec:
         # Set configurable option values
         def config_opts(opts: List[str]) -> dict:
             op = [(v[0] + self.config[v[1:]]) if len(v) > 1 and v[1] == '$' else v for v in opts]
-            return topts_s2d(op)
+            to = topts_s2d(op)
+            to.update({k: sys.intern(to[k]) for k in ('ktype', 'vtype') if k in to})    # Type references
+            return to
 
         def sym(t: TypeDefinition) -> SymbolTableField:  # Build symbol table based on encoding modes
             symval = SymbolTableField(
@@ -121,6 +156,12 @@ class Codec:
                     raise IndexError(f'symval index error: {e}')
                 if t.BaseType != 'Enumerated':
                     symval.Fld = {f[fx]: symf(f, fa, fnames) for f in t.Fields}
+                if t.BaseType == 'Array':       # Array fields are keyed by FieldID, precompute list order
+                    symval.Seq = [(f.FieldID - 1, f, symval.Fld[f.FieldID].Opt) for f in t.Fields]
+                if t.BaseType in ('Map', 'Record'):     # Resolve field entries and keys once per mode
+                    symval.Rec = [(f[fx], f, symval.Fld[f[fx]].Opt['minc'] > 0, symval.Fld[f[fx]].cTag)
+                                  for f in t.Fields]
+                    symval.Names = frozenset(fnames.values())
             if t.BaseType in ('Binary', 'String', 'Array', 'ArrayOf', 'Map', 'MapOf', 'Record'):
                 minv = symval.TypeOpts.get('minv', 0)
                 maxv = symval.TypeOpts.get('maxv', 0)
@@ -131,6 +172,8 @@ class Codec:
                     if t.BaseType in ('Binary', 'String'):
                         maxv = self.config[f'$Max{t.BaseType}']
                 symval.TypeOpts.update({'minv': minv, 'maxv': maxv})
+            if 'pattern' in symval.TypeOpts:
+                symval.Pattern = re.compile(symval.TypeOpts['pattern'])
             fmt = symval.TypeOpts.get('format', '')
             symval.FormatValidate = get_format_validate_function(self.format_validate, t.BaseType, fmt)
             symval.FormatEncode = get_format_encode_function(self.format_codec, t.BaseType, fmt)
@@ -139,9 +182,12 @@ class Codec:
 
         self.verbose_rec = verbose_rec
         self.verbose_str = verbose_str
-        self.symtab = {t.TypeName: sym(t) for t in object_types(self.schema['types'])}
+        # Intern type names so dispatch from field type references matches dict keys by identity
+        self.symtab = {sys.intern(t.TypeName): sym(t) for t in object_types(self.schema['types'])}
         if 'TypeRef' in self.types:
-            self.symtab['TypeRef'].TypeOpts = make_typeref_pattern(self.config['$NSID'], self.config['$TypeName'])
+            ts = self.symtab['TypeRef']
+            ts.TypeOpts = make_typeref_pattern(self.config['$NSID'], self.config['$TypeName'])
+            ts.Pattern = re.compile(ts.TypeOpts['pattern'])
         for t in PRIMITIVE_TYPES:
             self.symtab[t] = SymbolTableField(
                 TypeDef=TypeDefinition('', t),
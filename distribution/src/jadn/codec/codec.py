@@ -4,7 +4,7 @@ import re
 
 from dataclasses import dataclass
 from frozendict import frozendict
-from typing import Any, Callable, Dict, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from ..utils import raise_error
 from ..definitions import FieldID, FieldName, BasicDataclass, TypeDefinition, GenFieldDefinition
 # TODO: add DEFAULT to dataclasses
@@ -42,6 +42,14 @@ class SymbolTableField(BasicDataclass):
     eMap: Dict[Union[int, str], Union[int, str]] = None
     # 10: Field entries (definition and decoded options)
     Fld: Dict[str, SymbolTableFieldDefinition] = None
+    # 11: Compiled pattern option
+    Pattern: Optional[re.Pattern] = None
+    # 12: Array fields in order: (list index, field definition, field options)
+    Seq: Optional[List[Tuple[int, GenFieldDefinition, dict]]] = None
+    # 13: Map/Record fields in order: (encoded key, field definition, required, tagid field)
+    Rec: Optional[List[Tuple[Union[int, str], GenFieldDefinition, bool, Optional[Union[int, str]]]]] = None
+    # 14: Map/Record API field names
+    Names: Optional[frozenset] = None
 
 
 # Codec Table fields
@@ -55,6 +63,11 @@ class CodecTableField(BasicDataclass):
     eType: type = None
 
 
+# Builtin types of numeric values accepted without an abstract base class check
+INTEGER_TYPES = (int,)
+NUMBER_TYPES = (int, float)
+
+
 def fset(x):
     if isinstance(x, dict):
         return frozendict({k: fset(v) for k, v in x.items()})
@@ -92,6 +105,13 @@ def _check_type(ts: SymbolTableField, val: Any, vtype: type, fail=False) -> None
             raise_error(f'{tn}: {val} is not {vtype}')
 
 
+# Numeric values: exact builtin types take the fast path, other types are checked against the numbers ABC.
+# bool is a subclass of int but is not a valid Integer or Number
+def _check_number_type(ts: SymbolTableField, val: Any, vtype: type, builtin_types: Tuple[type, ...]) -> None:
+    if type(val) not in builtin_types:
+        _check_type(ts, val, vtype, isinstance(val, bool))
+
+
 def _format_encode(ts: SymbolTableField, val: Any) -> Any:
     try:
         ts.FormatValidate(val)
@@ -117,10 +137,9 @@ def _check_key(ts: SymbolTableField, val):
 
 
 def _check_pattern(ts: SymbolTableField, val):
-    op = ts.TypeOpts
-    if 'pattern' in op and not re.match(op['pattern'], val):
+    if ts.Pattern is not None and not ts.Pattern.match(val):
         tn = ts.TypeDef.TypeName
-        raise_error(f'{tn}: string "{val}" does not match {op["pattern"]}')
+        raise_error(f'{tn}: string "{val}" does not match {ts.TypeOpts["pattern"]}')
     return val
 
 
@@ -146,11 +165,11 @@ def _check_frange(ts: SymbolTableField, val):
 
 def _check_size(ts: SymbolTableField, val):
     op = ts.TypeOpts
-    tn = ts.TypeDef.TypeName
-    if 'minv' in op and len(val) < op['minv']:
-        raise_error(f'{tn}: length {len(val)} < minimum {op["minv"]}')
-    if 'maxv' in op and len(val) > op['maxv']:
-        raise_error(f'{tn}: length {len(val)} > maximum {op["maxv"]}')
+    n = len(val)
+    if n < op.get('minv', 0):
+        raise_error(f'{ts.TypeDef.TypeName}: length {n} < minimum {op["minv"]}')
+    if 'maxv' in op and n > op['maxv']:
+        raise_error(f'{ts.TypeDef.TypeName}: length {n} > maximum {op["maxv"]}')
     return val
 
 
@@ -193,26 +212,26 @@ def _decode_boolean(ts: SymbolTableField, val, codec: 'Codec'):
 
 
 def _encode_integer(ts: SymbolTableField, aval, codec: 'Codec'):
-    _check_type(ts, aval, numbers.Integral, isinstance(aval, bool))
+    _check_number_type(ts, aval, numbers.Integral, INTEGER_TYPES)
     _check_range(ts, aval)
     return _format_encode(ts, aval)
 
 
 def _decode_integer(ts: SymbolTableField, sval, codec: 'Codec'):
     aval = _format_decode(ts, sval)
-    _check_type(ts, aval, numbers.Integral, isinstance(aval, bool))
+    _check_number_type(ts, aval, numbers.Integral, INTEGER_TYPES)
     return _check_range(ts, aval)
 
 
 def _encode_number(ts: SymbolTableField, aval, codec: 'Codec'):
-    _check_type(ts, aval, numbers.Real, isinstance(aval, bool))
+    _check_number_type(ts, aval, numbers.Real, NUMBER_TYPES)
     _check_frange(ts, aval)
     return _format_encode(ts, aval)
 
 
 def _decode_number(ts: SymbolTableField, sval, codec: 'Codec'):
     aval = _format_decode(ts, sval)
-    _check_type(ts, aval, numbers.Real, isinstance(aval, bool))
+    _check_number_type(ts, aval, numbers.Real, NUMBER_TYPES)
     return _check_range(ts, aval)
 
 
@@ -279,11 +298,11 @@ def _encode_choice(ts: SymbolTableField, val, codec: 'Codec'):
     if len(val) != 1:
         _bad_choice(ts, val)
     k, v = next(iter(val.items()))
-    if k not in ts.eMap:
+    try:
+        k = ts.eMap[k]      # API tag to encoded tag, a single lookup also rejects unknown tags
+    except KeyError:
         _bad_value(ts, val)
-    k = ts.eMap[k]
-    f = ts.Fld[k].Def
-    return {k: codec.encode(f.FieldType, v)}
+    return {k: codec.encode(ts.Fld[k].Def.FieldType, v)}
 
 
 def _decode_choice(ts: SymbolTableField, val, codec: 'Codec'):  # Map Choice:  val == {key: value}
@@ -292,6 +311,10 @@ def _decode_choice(ts: SymbolTableField, val, codec: 'Codec'):  # Map Choice:  v
         ct, cf = 0, 0  # true and false field counts
         field, v = None, None
         for field in ts.TypeDef.Fields:
+            fs = codec.symtab.get(field.FieldType)
+            if fs is not None and fs.Decode in _ENCTYPE_DECODERS and not isinstance(val, fs.EncType):
+                cf += 1     # Decoder would reject the value's type, skip raising and catching its error
+                continue
             try:
                 v = codec.decode(field.FieldType, val)
                 ct += 1
@@ -313,11 +336,11 @@ def _decode_choice(ts: SymbolTableField, val, codec: 'Codec'):  # Map Choice:  v
         _bad_choice(ts, val)
     k, v = next(iter(val.items()))
     k = _check_key(ts, k)
-    if k not in ts.dMap:
+    try:
+        f = ts.Fld[k].Def   # Fld and dMap are keyed by encoded tag
+    except KeyError:
         _bad_value(ts, val)
-    f = ts.Fld[k].Def
-    k = ts.dMap[k]
-    return {k: codec.decode(f.FieldType, v)}
+    return {ts.dMap[k]: codec.decode(f.FieldType, v)}
 
 
 def _encode_maprec(ts: SymbolTableField, aval, codec: 'Codec'):
@@ -325,29 +348,24 @@ def _encode_maprec(ts: SymbolTableField, aval, codec: 'Codec'):
     _check_size(ts, aval)
     sval = ts.EncType()
     assert isinstance(sval, (list, dict))
-    fx = FieldName if codec.verbose_str else FieldID  # Verbose or minified identifier strings
-    fnames = [f.Def.FieldName for f in ts.Fld.values()]
-    for f in ts.TypeDef.Fields:
-        fs = ts.Fld[f[fx]]  # Symtab entry for field
-        fd = fs.Def  # JADN field definition from symtab
-        fname = fd[FieldName]  # Field name
-        fopts = fs.Opt  # Field options dict
-        ctag = fs.cTag
+    concise = isinstance(sval, list)
+    for fk, fd, req, ctag in ts.Rec:
+        fname = fd.FieldName
         if ctag is not None:  # Type of this field is specified by contents of another field
             e = codec.encode(fd.FieldType, {aval[ctag]: aval[fname]})
             sv = next(iter(e.values()))
         else:
             sv = codec.encode(fd.FieldType, aval[fname]) if fname in aval else None
-        if sv is None and ('minc' not in fopts or fopts['minc'] > 0):  # Missing required field
+        if sv is None and req:  # Missing required field
             _bad_value(ts, aval, fd)
-        if isinstance(sval, list):  # Concise Record
+        if concise:  # Concise Record
             sval.append(sv)
         elif sv is not None:  # Map or Verbose Record
-            sval[fd[fx]] = sv
+            sval[fk] = sv
 
-    if extras := set(aval) - set(fnames):
+    if extras := aval.keys() - ts.Names:
         _extra_value(ts, aval, extras)
-    if isinstance(sval, list):
+    if concise:
         while sval and sval[-1] is None:  # Strip non-populated trailing optional values
             sval.pop()
     return sval
@@ -357,33 +375,26 @@ def _decode_maprec(ts: SymbolTableField, sval, codec: 'Codec'):
     _check_type(ts, sval, ts.EncType)
     _check_size(ts, sval)   # TODO: _check_count() for concise records
     val = sval
-    if ts.EncType == dict:
+    verbose = ts.EncType == dict
+    if verbose:
         val = {_check_key(ts, k): v for k, v in sval.items()}
     aval = dict()
-    fx = FieldName if codec.verbose_str else FieldID  # Verbose or minified identifier strings
-    fnames = list(ts.Fld)
-    for f in ts.TypeDef.Fields:
-        fs = ts.Fld[f[fx]]  # Symtab entry for field
-        fd = fs.Def  # JADN field definition from symtab
-        fopts = fs.Opt  # Field options dict
-        if isinstance(val, dict):
-            fn = f[fx]
-            sv = val[fn] if fn in val else None
+    for fk, fd, req, ctag in ts.Rec:
+        if verbose:
+            sv = val.get(fk)
         else:
-            fn = fd[FieldID] - 1
+            fn = fd.FieldID - 1
             sv = val[fn] if len(val) > fn else None
         if sv is not None:
-            ctag = fs.cTag
             if ctag is not None:  # Type of this field is specified by contents of another field
-                ct = ctag if isinstance(val, dict) else ts.eMap[ctag] - 1
+                ct = ctag if verbose else ts.eMap[ctag] - 1
                 av = codec.decode(fd.FieldType, {sval[ct]: sv})
-                aval[fd[FieldName]] = next(iter(av.values()))
+                aval[fd.FieldName] = next(iter(av.values()))
             else:
-                aval[fd[FieldName]] = codec.decode(fd.FieldType, sv)
-        else:
-            if 'minc' not in fopts or fopts['minc'] > 0:
-                _bad_value(ts, val, fd)
-    extra = set(val) - set(fnames) if isinstance(val, dict) else set(val[len(ts.Fld):])
+                aval[fd.FieldName] = codec.decode(fd.FieldType, sv)
+        elif req:
+            _bad_value(ts, val, fd)
+    extra = val.keys() - ts.Fld.keys() if verbose else set(val[len(ts.Fld):])
     if extra:
         _extra_value(ts, val, extra)
     return aval
@@ -396,10 +407,7 @@ def _encode_array(ts: SymbolTableField, aval, codec: 'Codec'):
     sval = list()
     if len(aval) > len(ts.Fld):
         _extra_value(ts, aval, set(aval[len(ts.Fld):]))
-    for fn in ts.TypeDef.Fields:
-        f = ts.Fld[fn.FieldID].Def  # Use symtab field definition
-        fx = f.FieldID - 1
-        fopts = ts.Fld[fx + 1].Opt
+    for fx, f, fopts in ts.Seq:
         av = aval[fx] if len(aval) > fx else None
         if av is not None:
             if 'tagid' in fopts:
@@ -425,10 +433,7 @@ def _decode_array(ts: SymbolTableField, sval, codec: 'Codec'):  # Ordered list o
     aval = list()
     if len(val) > len(ts.Fld):
         _extra_value(ts, val, set(aval[len(ts.Fld):]))
-    for fn in ts.TypeDef.Fields:
-        f = ts.Fld[fn[FieldID]].Def  # Use symtab field definition
-        fx = f[FieldID] - 1
-        fopts = ts.Fld[fx + 1].Opt
+    for fx, f, fopts in ts.Seq:
         sv = val[fx] if len(val) > fx else None
         if sv is not None:
             if 'tagid' in fopts:
@@ -453,7 +458,8 @@ def _encode_array_of(ts: SymbolTableField, val, codec: 'Codec'):
     if 'set' in ts.TypeOpts or 'unique' in ts.TypeOpts:
         if len(val) != len(fset(val)):
             _bad_value(ts, val)
-    return [codec.encode(ts.TypeOpts['vtype'], v) for v in val]
+    enc = codec.encoder(ts.TypeOpts['vtype'])     # Resolve element type once, not per element
+    return [enc(v) for v in val]
 
 
 def _decode_array_of(ts: SymbolTableField, val, codec: 'Codec'):
@@ -462,7 +468,8 @@ def _decode_array_of(ts: SymbolTableField, val, codec: 'Codec'):
     if 'set' in ts.TypeOpts or 'unique' in ts.TypeOpts:
         if len(val) != len(fset(val)):
             _bad_value(ts, val)
-    return [codec.decode(ts.TypeOpts['vtype'], v) for v in val]
+    dec = codec.decoder(ts.TypeOpts['vtype'])     # Resolve element type once, not per element
+    return [dec(v) for v in val]
 
 
 def _encode_map_of(ts: SymbolTableField, aval, codec: 'Codec'):
@@ -492,3 +499,6 @@ enctab: Dict[str, CodecTableField] = {  # decode, encode, min encoded type
     'MapOf': CodecTableField(_decode_map_of, _encode_map_of, dict),
     'Record': CodecTableField(),  # Dynamic values
 }
+
+# Decoders whose first check is that the value is an instance of the type's EncType
+_ENCTYPE_DECODERS = {_decode_array_of, _decode_map_of, _decode_maprec}
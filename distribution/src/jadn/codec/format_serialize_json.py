@@ -1,14 +1,15 @@
 import base64
-import binascii
 import re
 import string
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from ipaddress import IPv4Address, IPv6Address
 from typing import Any, Callable, Dict, Tuple
 from ..definitions import FORMAT_SERIALIZE
 
-UUID = r'(?i)^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89AB][0-9a-f]{3}-[0-9a-f]{12}$'
+UUID = re.compile(r'(?i)^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89AB][0-9a-f]{3}-[0-9a-f]{12}$')
+
+EPOCH = datetime(1970, 1, 1)    # Naive UTC
 
 FormatFunction = Callable[[Any], Any]
 FormatTable = Dict[str, Dict[str, Tuple[FormatFunction, FormatFunction]]]
@@ -38,26 +39,39 @@ def get_format_decode_function(format_table: FormatTable, base_type: str, format
 
 
 # Binary to String, String to Binary conversion functions
+def _fromhex(sval: str) -> bytes:       # bytes.fromhex, but reject whitespace between digits
+    try:
+        bval = bytes.fromhex(sval)
+    except (TypeError, ValueError):
+        raise TypeError
+    if 2 * len(bval) != len(sval):
+        raise TypeError
+    return bval
+
+
 def b2s_hex(bval: bytes) -> str:      # Convert from binary to hex string
-    return base64.b16encode(bval).decode()
+    return bval.hex().upper()
 
 
 def s2b_hex(sval: str) -> bytes:      # Convert from hex string to binary
-    try:
-        return base64.b16decode(sval)
-    except binascii.Error:
+    bval = _fromhex(sval)
+    if sval.upper() != sval:            # Upper case only
         raise TypeError
+    return bval
 
 
 def b2s_hex_lc(bval: bytes) -> str:      # Convert from binary to hex string
-    return base64.b16encode(bval).decode().lower()
+    return bval.hex()
 
 
 def s2b_hex_lc(sval: str) -> bytes:      # Convert from hex string to binary
-    try:
-        return base64.b16decode(sval, casefold=True)
-    except binascii.Error:
-        raise TypeError
+    return _fromhex(sval)
+
+
+def s2b_eui(sval: str) -> bytes:      # Convert EUI-48 or EUI-64 from hex string to binary
+    if len(sval) not in (12, 16):       # Reject bad lengths before converting
+        raise TypeError(f'{sval}: EUI must be 12 or 16 hex digits')
+    return s2b_hex(sval)
 
 
 def b2s_base64url(bval: bytes) -> str:      # Convert from binary to base64url string
@@ -92,13 +106,13 @@ def s2b_ipv6_addr(sval: str) -> bytes:    # Convert IPv6 address from string to
 def b2s_uuid(bval: bytes) -> str:   # Convert RFC 4122 UUID from 128 bit value to text representation
     u = b2s_hex_lc(bval)
     us = f'{u[:8]}-{u[8:12]}-{u[12:16]}-{u[16:20]}-{u[20:]}'
-    if m := re.match(UUID, us):
+    if m := UUID.match(us):
         return us
     raise ValueError
 
 
 def s2b_uuid(sval: str) -> bytes:   # Convert RFC 4122 UUID from text to 128 bit value
-    if m := re.match(UUID, sval):
+    if m := UUID.match(sval):
         return s2b_hex_lc(sval.replace('-', ''))
     raise ValueError
 
@@ -109,7 +123,7 @@ FORMAT_CONVERT_BINARY_FUNCTIONS = {
     'X': (b2s_hex, s2b_hex),                        # Hex upper case (RFC conforming)
     'ipv4-addr': (b2s_ipv4_addr, s2b_ipv4_addr),    # IPv4 Address
     'ipv6-addr': (b2s_ipv6_addr, s2b_ipv6_addr),    # IPv6 Address
-    'eui': (b2s_hex, s2b_hex),                      # EUI - TODO: write colon-hex A0:32:F9:...
+    'eui': (b2s_hex, s2b_eui),                      # EUI - TODO: write colon-hex A0:32:F9:...
     'uuid': (b2s_uuid, s2b_uuid),                   # 128 bit UUID with RFC 4122 text representation
 }
 
@@ -163,11 +177,9 @@ FORMAT_CONVERT_MULTIPART_FUNCTIONS = {
 }
 
 
-def int2datems(dt: int) -> str:
-    y = datetime.isoformat(datetime.fromtimestamp(dt/1000., timezone.utc))
-    if m := re.match(r'^(.+)(\.\d\d\d)(\d\d\d)(.+)$', y):   # strip microseconds to milliseconds
-        y = m.group(1) + m.group(2) + m.group(4)
-    return y
+def int2datems(dt: int) -> str:     # Naive UTC arithmetic is exact and skips tzinfo calls in isoformat
+    y = EPOCH + timedelta(milliseconds=dt)
+    return y.isoformat(timespec='milliseconds' if dt % 1000 else 'seconds') + '+00:00'
 
 
 def datems2int(dts: str) -> int:
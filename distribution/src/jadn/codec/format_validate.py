@@ -2,7 +2,9 @@ import re
 import jsonschema
 
 from copy import deepcopy
-from typing import Any, Dict, Callable
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Callable, Mapping
 from ..definitions import FORMAT_JS_VALIDATE, FORMAT_VALIDATE, FORMAT_SERIALIZE
 
 ValidationFunction = Callable[[Any], Any]
@@ -27,21 +29,26 @@ def get_format_validate_function(format_table: FormatTable, base_type: str, form
 
 # Regex from https://stackoverflow.com/questions/201323/how-to-validate-an-email-address-using-a-regular-expression
 #   A more comprehensive email address validator is available at http://isemail.info/about
+RFC5322_RE = re.compile(
+    r"(?:[a-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[a-z0-9!#$%&'*+/=?^_`{|}~-]+)*|"
+    r'"(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21\x23-\x5b\x5d-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])*")@'
+    r"(?:(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)+[a-z0-9](?:[a-z0-9-]*[a-z0-9])?|\[(?:(?:(2(5[0-5]|[0-4][0-9])"
+    r"|1[0-9][0-9]|[1-9]?[0-9]))\.){3}(?:(2(5[0-5]|[0-4][0-9])|1[0-9][0-9]|[1-9]?[0-9])|[a-z0-9-]*[a-z0-9]"
+    r":(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21-\x5a\x53-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])+)\])")
+
+
 def s_email(sval: str) -> str:
     if not isinstance(sval, type('')):
         raise TypeError
-    rfc5322_re = (
-        r"(?:[a-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[a-z0-9!#$%&'*+/=?^_`{|}~-]+)*|"
-        r'"(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21\x23-\x5b\x5d-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])*")@'
-        r"(?:(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)+[a-z0-9](?:[a-z0-9-]*[a-z0-9])?|\[(?:(?:(2(5[0-5]|[0-4][0-9])"
-        r"|1[0-9][0-9]|[1-9]?[0-9]))\.){3}(?:(2(5[0-5]|[0-4][0-9])|1[0-9][0-9]|[1-9]?[0-9])|[a-z0-9-]*[a-z0-9]"
-        r":(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21-\x5a\x53-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])+)\])")
-    if re.match(rfc5322_re, sval):
+    if RFC5322_RE.match(sval):
         return sval
     raise ValueError
 
 
 # From https://stackoverflow.com/questions/2532053/validate-a-hostname-string
+HOSTNAME_LABEL_RE = re.compile(r"(?!-)[A-Z\d-]{1,63}(?<!-)$", re.IGNORECASE)
+
+
 def s_hostname(sval: str) -> str:
     if not isinstance(sval, type('')):
         raise TypeError
@@ -50,8 +57,7 @@ def s_hostname(sval: str) -> str:
         hostname = hostname[:-1]  # strip exactly one dot from the right, if present
     if len(sval) > 253:
         raise ValueError
-    allowed = re.compile(r"(?!-)[A-Z\d-]{1,63}(?<!-)$", re.IGNORECASE)
-    if all(allowed.match(x) for x in hostname.split(".")):
+    if all(HOSTNAME_LABEL_RE.match(x) for x in hostname.split(".")):
         return sval
     raise ValueError
 
@@ -105,28 +111,22 @@ def a_ipv6_net(aval: [bytes, int]) -> [bytes, int]:       # IPv6 address and net
     return _ipnet(aval, lambda x: len(x[0]) == 16 and 0 <= x[1] <= 128)
 
 
-def val_int(ival: int, condition: Callable[[int], bool]) -> int:
-    if not isinstance(ival, int):
-        raise TypeError
-    if condition(ival):
-        return ival
-    raise ValueError
-
-
-def i_i8(ival: int) -> int:
-    return val_int(ival, lambda x: -2**7 <= x < 2**7)
+def val_int(bits: int) -> Callable[[int], int]:   # Signed integer of the given size, bounds computed once
+    lo, hi = -2**(bits - 1), 2**(bits - 1)
 
-
-def i_i16(ival: int) -> int:
-    return val_int(ival, lambda x: -2**15 <= x < 2**15)
-
-
-def i_i32(ival: int) -> int:
-    return val_int(ival, lambda x: -2**31 <= x < 2**31)
+    def validate(ival: int) -> int:
+        if not isinstance(ival, int):
+            raise TypeError
+        if lo <= ival < hi:
+            return ival
+        raise ValueError
+    return validate
 
 
-def i_i64(ival: int) -> int:
-    return val_int(ival, lambda x: -2**63 <= x < 2**63)
+i_i8 = val_int(8)
+i_i16 = val_int(16)
+i_i32 = val_int(32)
+i_i64 = val_int(64)
 
 
 # Semantic validation functions
@@ -162,17 +162,18 @@ FORMAT_VALIDATE_FUNCTIONS = {
 
 
 # Create a table of validation functions for format keywords
-def format_validators() -> FormatTable:  # Generate validation function table
+@lru_cache(maxsize=None)
+def _format_validators() -> Mapping[str, Mapping[str, ValidationFunction]]:  # Generate read-only table once
     # Create a closure for a JSON Schema format keyword
     def make_jsonschema_validator(format_kw: str) -> Callable[[str], str]:
+        checker = jsonschema.Draft202012Validator.FORMAT_CHECKER    # Call the format check directly, no validator
+
         def validate(val: str) -> str:
+            if not isinstance(val, str):
+                raise ValueError(f'{val!r} is not of type \'string\'')
             try:
-                jsonschema.validate(
-                    instance=val,
-                    schema={'type': 'string', 'format': format_kw},
-                    format_checker=jsonschema.draft202012_format_checker    # Replace with cls=validator
-                )
-            except jsonschema.exceptions.ValidationError as e:
+                checker.check(val, format_kw)
+            except jsonschema.exceptions.FormatError as e:
                 raise ValueError(e.message)
             return val
         return validate
@@ -183,4 +184,8 @@ def format_validators() -> FormatTable:  # Generate validation function table
     # Add JSON Schema validation functions to those defined here
     validation_functions = deepcopy(FORMAT_VALIDATE_FUNCTIONS)
     validation_functions['String'].update({f: make_jsonschema_validator(f) for f in FORMAT_JS_VALIDATE})
-    return validation_functions
+    return MappingProxyType({k: MappingProxyType(v) for k, v in validation_functions.items()})
+
+
+def format_validators() -> FormatTable:     # Return a copy of the table that the caller may modify
+    return {k: dict(v) for k, v in _format_validators().items()}
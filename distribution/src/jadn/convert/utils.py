@@ -3,7 +3,7 @@ Conversion utilities
 """
 from typing import Callable, Tuple, Union
 from lxml.etree import Element, tostring  # pylint: disable=E0611
-from lxml.html import builder
+from lxml.html import builder, html_parser
 
 
 class Doc:
@@ -89,8 +89,10 @@ class DocHTML(Doc):
             super().__init__(doc, name, text, **kwargs)
             if cls := kwargs.pop('klass', None):
                 kwargs['class'] = cls
-            child = (text, ) if text else ()
-            self.value = getattr(builder, name.upper())(*child, **kwargs)
+            # Same element builder.E would make, without its per-call argument dispatch
+            self.value = html_parser.makeelement(name.lower(), kwargs)
+            if text:
+                self.value.text = text
 
 
 class DocXML(Doc):
@@ -8,20 +8,24 @@ import os
 import jadn
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, TextIO, Union
 from urllib.parse import urlparse
 from .definitions import (
     TypeName, FieldID, FieldName, FieldType, FieldDesc, FIELD_LENGTH,
     OPTION_ID, REQUIRED_TYPE_OPTIONS, ALLOWED_TYPE_OPTIONS, VALID_FORMATS, is_builtin, has_fields
 )
-from .utils import raise_error, list_get_default, TypeDefinition, GenFieldDefinition
+from .utils import raise_error, TypeDefinition, GenFieldDefinition
+
+
+_DATA_DIR = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'data')     # Fixed at import
 
 
 def data_dir() -> str:
     """
     Return directory containing JADN schema files
     """
-    return os.path.join(os.path.abspath(os.path.dirname(__file__)), 'data')
+    return _DATA_DIR
 
 
 # Check schema is valid
@@ -52,6 +56,19 @@ def check_typeopts(type_name: str, base_type: str, topts: dict) -> None:
         raise_error(f'Unsupported union+intersection in {type_name} {base_type}')
 
 
+# The checking schemas are package data, load them once and build one meta-schema codec per config
+@lru_cache(maxsize=None)
+def _json_schema_validator() -> jsonschema.Draft7Validator:
+    with open(os.path.join(data_dir(), 'jadn_v1.1_schema.json')) as f:
+        return jsonschema.Draft7Validator(json.load(f))
+
+
+@lru_cache(maxsize=None)
+def _meta_schema_codec(config: tuple) -> 'jadn.codec.Codec':
+    with open(os.path.join(data_dir(), 'jadn_v1.1_schema.jadn')) as f:
+        return jadn.codec.Codec(json.load(f), verbose_rec=True, verbose_str=True, config={'info': {'config': dict(config)}})
+
+
 # TODO: finish convert to use dataclasses??
 def check(schema: dict) -> dict:
     """
@@ -63,13 +80,11 @@ def check(schema: dict) -> dict:
     schema_types = [TypeDefinition(*t) for t in schema['types']]
     schema['types'] = [list(t) for t in schema_types]
 
-    data_path = data_dir()
-    with open(os.path.join(data_path, 'jadn_v1.1_schema.json')) as f:     # Check using JSON Schema for JADN
-        jsonschema.Draft7Validator(json.load(f)).validate(schema)
+    _json_schema_validator().validate(schema)       # Check using JSON Schema for JADN
 
-    with open(os.path.join(data_path, 'jadn_v1.1_schema.jadn')) as f:     # Optional: check using JADN meta-schema
-        meta_schema = jadn.codec.Codec(json.load(f), verbose_rec=True, verbose_str=True, config=schema)
-        assert meta_schema.encode('Schema', schema) == schema
+    config = jadn.get_config(schema.get('info'))    # Optional: check using JADN meta-schema
+    meta_schema = _meta_schema_codec(tuple(sorted(config.items())))
+    assert meta_schema.encode('Schema', schema) == schema
 
     # Additional checks not included in schema
     types = {}
@@ -92,37 +107,40 @@ def check(schema: dict) -> dict:
         # Defined fields if there shouldn't be any
         if ('enum' in type_opts or 'pointer' in type_opts) and fields:
             raise_error(f'{type_def.TypeName}({type_def.BaseType}) should not have defined fields with the option enum/pointer')
-        # Invalid anonymous field types
-        for fd in fields:
-            if has_fields(fd[FieldType]):
-                raise_error(f'{type_def[TypeName]}/{fd[FieldName]}({fd[FieldID]}): Invalid type "{fd[FieldType]}"')
+        # Walk the fields once, report errors in the order of the checks below
+        flen = FIELD_LENGTH[type_def.BaseType]  # Field item count
+        ordinal = type_def.BaseType in ('Array', 'Record')
+        bad_type = bad_len = bad_tag = None
+        fids, fnames, dup_ids, dup_names = set(), set(), set(), set()
+        for n, f in enumerate(fields, 1):
+            if bad_type is None and has_fields(f[FieldType]):
+                bad_type = f
+            (dup_ids if f[FieldID] in fids else fids).add(f[FieldID])
+            (dup_names if f[FieldName] in fnames else fnames).add(f[FieldName])
+            if bad_len is None and len(f) != flen:
+                bad_len = f
+            if ordinal and bad_tag is None and f[FieldID] != n:
+                bad_tag = (f, n)
 
+        # Invalid anonymous field types
+        if bad_type is not None:
+            raise_error(f'{type_def[TypeName]}/{bad_type[FieldName]}({bad_type[FieldID]}): Invalid type "{bad_type[FieldType]}"')
 
         # Duplicates
-        def duplicates(seq):
-            seen = set()
-            return set(x for x in seq if x in seen or seen.add(x))
-
-        if dd := duplicates((f[FieldID] for f in fields)):
-            raise_error(f'Duplicate fieldID: {type_def.TypeName} {dd}')
-        if dd := duplicates((f[FieldName] for f in fields)):
-            raise_error(f'Duplicate field name {type_def.TypeName} {dd}')
-        # fids = {f[FieldID] for f in fields}  # Field IDs
-        # fnames = {f[FieldName] for f in fields}  # Field Names
-        # if len(fields) != len(fids) or len(fields) != len(fnames):
-        #    raise_error(f'Duplicate field {type_def.TypeName} {len(fields)} fields, {len(fids)} unique tags, {len(fnames)} unique names')
+        if dup_ids:
+            raise_error(f'Duplicate fieldID: {type_def.TypeName} {dup_ids}')
+        if dup_names:
+            raise_error(f'Duplicate field name {type_def.TypeName} {dup_names}')
 
         # Invalid definitions of field
-        flen = FIELD_LENGTH[type_def.BaseType]  # Field item count
-        if invalid := list_get_default([f for f in fields if len(f) != flen], 0):
-            raise_error(f'Bad field id=`{invalid[FieldID]}` in {type_def.TypeName} length, {len(invalid)} should be {flen}')
+        if bad_len is not None:
+            raise_error(f'Bad field id=`{bad_len[FieldID]}` in {type_def.TypeName} length, {len(bad_len)} should be {flen}')
 
         # Specific checks
         # Ordinal indexes
-        if type_def.BaseType in ('Array', 'Record'):
-            if invalid := list_get_default([(f, n) for n, f in enumerate(fields, 1) if f[FieldID] != n], 0):
-                field, idx = invalid
-                raise_error(f'Item tag error: {type_def.TypeName}({type_def.BaseType}) [{field[FieldName]}] -- {field[FieldID]} should be {idx}')
+        if bad_tag is not None:
+            field, idx = bad_tag
+            raise_error(f'Item tag error: {type_def.TypeName}({type_def.BaseType}) [{field[FieldName]}] -- {field[FieldID]} should be {idx}')
 
         # Full Fields -> Array, Choice, Map, Record
         if flen > FieldDesc:  # Full field, not an Enumerated item
@@ -134,7 +152,7 @@ def check(schema: dict) -> dict:
                     raise_error(f'{type_def.TypeName}/{field.FieldName} bad multiplicity {minc} {maxc}')
 
                 if tf := fo.get('tagid', None):
-                    if tf not in {f[FieldID] for f in fields}:
+                    if tf not in fids:
                         raise_error(f'{type_def.TypeName}/{field.FieldName}({field.FieldType}) choice has bad external tag {tf}')
                 if is_builtin(field.FieldType):
                     check_typeopts(f'{type_def.TypeName}/{field.FieldName}', field.FieldType, fto)
@@ -185,9 +203,13 @@ def load_any(fp: TextIO) -> dict:
     return loader(fp)
 
 
+# json.dumps builds a new encoder for each call with non-default arguments, build one for all scalar values
+_dumps_scalar = json.JSONEncoder(ensure_ascii=False).encode
+
+
 def dumps_rec(val: Any, level: int = 0, indent: int = 2, strip: bool = False) -> str:
     if isinstance(val, (numbers.Number, type(''))):
-        return json.dumps(val, ensure_ascii=False)
+        return _dumps_scalar(val)
 
     sp = level * indent * ' '
     sp2 = (level + 1) * indent * ' '
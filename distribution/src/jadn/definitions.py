@@ -40,17 +40,17 @@ class BasicDataclass:
         if isinstance(key, slice):
             return [self[k] for k in self.__keyindex__[key]]
         if isinstance(key, int):
-            key = list(self.__keyindex__)[key]
+            key = self.__keyindex__[key]
         return object.__getattribute__(self, key)
 
     def __setitem__(self, key: Union[int, str], val: any):
         if isinstance(key, int):
-            key = list(self.__keyindex__)[key]
+            key = self.__keyindex__[key]
         return object.__setattr__(self, key, val)
 
     def __delitem__(self, key: Union[int, str]):
         if isinstance(key, int):
-            key = list(self.__keyindex__)[key]
+            key = self.__keyindex__[key]
         object.__setattr__(self, self.__default__[key], self.__default__[key])
 
     def __len__(self):
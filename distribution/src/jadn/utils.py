@@ -150,13 +150,15 @@ def topts_s2d(olist: Union[list[OPTION_TYPES], tuple[OPTION_TYPES, ...]], frange
     Convert list of type definition option strings to options dictionary
     """
     assert isinstance(olist, (list, tuple)), f'{olist} is not a list'
-    topts = {o for o in olist if ord(o[0]) in TYPE_OPTIONS}
-    if uopts := {*olist} - topts:
-        raise_error(f"Unknown type options: {','.join(uopts)}")
     opts = {}
-    for o in topts:
-        k, v, _ = TYPE_OPTIONS[ord(o[0])]
-        opts[k] = v(o[1:])
+    uopts = []
+    for o in olist:     # Option tag is the first character, dispatch on its ordinal
+        if opt := TYPE_OPTIONS.get(ord(o[0])):
+            opts[opt[0]] = opt[1](o[1:])
+        else:
+            uopts.append(o)
+    if uopts:
+        raise_error(f"Unknown type options: {','.join(uopts)}")
     return opts
 
 
@@ -167,14 +169,13 @@ def ftopts_s2d(olist: Union[list[OPTION_TYPES], tuple[OPTION_TYPES, ...]]) -> tu
     """
     assert isinstance(olist, (list, tuple)), f'{olist} is not a list'
     fopts = {}
-    topts = {}
+    topts = []
     for o in olist:
-        try:
-            k, v, _ = FIELD_OPTIONS[ord(o[0])]
-            fopts[k] = v(o[1:])
-        except KeyError:
-            topts.update(topts_s2d([o]))
-    return fopts, topts
+        if opt := FIELD_OPTIONS.get(ord(o[0])):
+            fopts[opt[0]] = opt[1](o[1:])
+        else:
+            topts.append(o)     # Type options of an anonymous field type, converted together
+    return fopts, topts_s2d(topts) if topts else {}
 
 
 def opts_d2s(to: dict) -> list[str]:
@@ -201,6 +202,10 @@ def opts_sort(olist: Union[list[OPTION_TYPES], tuple[OPTION_TYPES, ...]]) -> Non
     olist.sort(key=lambda x: opt_order(x[0]))
 
 
+def _copy_list(val: Any) -> Any:     # Copy nested lists or tuples of scalars, the layout of type definitions
+    return [_copy_list(v) for v in val] if isinstance(val, (list, tuple)) else val
+
+
 def canonicalize(schema: dict) -> dict:
     def can_opts(olist: list[OPTION_TYPES], basetype: str):
         opts_sort(olist)                # Sort options into canonical order (for comparisons)
@@ -219,7 +224,8 @@ def canonicalize(schema: dict) -> dict:
             if maxf is not None and '.' not in olist[maxf]:
                 olist[maxf] += '.0'
 
-    cschema = copy.deepcopy(schema)     # don't modify original
+    # don't modify original - type definitions hold only lists or tuples and scalars, so skip deepcopy's memo
+    cschema = {k: _copy_list(v) if k == 'types' else copy.deepcopy(v) for k, v in schema.items()}
     for td in cschema['types']:
         can_opts(td[TypeOptions], td[BaseType])
         for fd in td[Fields]:
@@ -1,11 +1,19 @@
 """
 Test JADN Codec
+
+Test classes share no state other than per-process caches, so they can be split across workers
+by class with pytest-xdist:  pytest -n auto --dist loadscope tests/test_codec.py
 """
 import binascii
 import json
+import os
+import time
 import unittest
 import jadn
-from collections import Counter
+from collections import Counter, namedtuple
+from enum import IntEnum
+from fractions import Fraction
+from types import SimpleNamespace
 
 
 # Encode and decode data to verify that numeric object keys work properly when JSON converts them to strings
@@ -13,7 +21,225 @@ def _j(data):
     return json.loads(json.dumps(data))
 
 
+# Class schemas are constants, so each one only needs to be checked once per test run.
+_SCHEMA_CHECKED = set()
+
+
+def _check_once(schema):
+    if id(schema) not in _SCHEMA_CHECKED:
+        jadn.check(schema)
+        _SCHEMA_CHECKED.add(id(schema))
+
+
+def _must_raise(test, fn, *args, exc=ValueError):  # Cheaper than assertRaises for large numbers of bad values
+    try:
+        fn(*args)
+    except exc:
+        return
+    test.fail(f'{fn.__name__}{args} did not raise {exc}')
+
+
+def _must_raise_both(test, enc, dec, *args):   # Verbose values that are invalid in both directions
+    _must_raise(test, enc, *args)
+    _must_raise(test, dec, *args)
+
+
+def _raises_all(test, fn, t, bad_cases):    # fn is a codec's encode or decode, each bad value must fail
+    for bad in bad_cases:
+        with test.subTest(t=t, bad=bad):
+            _must_raise(test, fn, t, bad)
+
+
+class _LazyCodec:   # Class attribute that checks the schema and builds a codec for one mode on first access
+    def __init__(self, verbose_rec=False, verbose_str=False):
+        self.mode = {'verbose_rec': verbose_rec, 'verbose_str': verbose_str}
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, cls):
+        if (base := cls.__dict__.get('_codec_base')) is None:     # First codec of this class
+            _check_once(cls.schema)
+            codec = cls._codec_base = jadn.codec.Codec(cls.schema, **self.mode)
+        else:       # Other modes share the first codec's schema setup
+            codec = base.with_mode(**self.mode)
+        setattr(cls, self.name, codec)      # Later lookups find the codec, not this descriptor
+        return codec
+
+
+def _idem(test, tc, t, val):    # Value that encodes and decodes to itself, accept the same object without comparing
+    for op in (tc.encode, tc.decode):
+        out = op(t, val)
+        test.assertTrue(out is val or out == val, f'{op.__name__} {t}: {out!r} != {val!r}')
+
+
+def _make_case(codec, op, t, val, *expected):   # Test op on codec, returning expected or raising ValueError if none
+    def test(self):
+        fn = getattr(getattr(self, codec), op)
+        if expected:
+            self.assertEqual(fn(t, val), expected[0])
+        else:
+            _must_raise(self, fn, t, val)
+    return test
+
+
+class _CaseTable(unittest.TestCase):
+    """
+    Generate one test method for each encode, decode, and bad value in a subclass's CASES table.
+
+    CASES rows: (name, codec attribute, type name, ((API value, serialized value), ...), bad API values, bad serialized values)
+    """
+    CASES = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name, codec, t, pairs, bad_api, bad_ser in cls.CASES:
+            for n, (aval, sval) in enumerate(pairs, start=1):
+                setattr(cls, f'test_{name}_encode_{n}', _make_case(codec, 'encode', t, aval, sval))
+                setattr(cls, f'test_{name}_decode_{n}', _make_case(codec, 'decode', t, sval, aval))
+            for n, bad in enumerate(bad_api, start=1):
+                setattr(cls, f'test_{name}_bad_api_{n}', _make_case(codec, 'encode', t, bad))
+            for n, bad in enumerate(bad_ser, start=1):
+                setattr(cls, f'test_{name}_bad_ser_{n}', _make_case(codec, 'decode', t, bad))
+
+
+class _Level(IntEnum):     # Subclasses of the builtin types are valid primitive values
+    LOW = 1
+
+
+class _Name(str):
+    pass
+
+
+# BasicTypes API and serialized values
+_F = SimpleNamespace(
+    Prim_good=(                         # Primitive values that encode and decode to themselves
+        ('T-bool', (True, False)),
+        ('T-int', (35, _Level.LOW)),
+        ('T-num', (25.96, 25, _Level.LOW, Fraction(1, 3))),
+        ('T-str', ('parrot', _Name('parrot'))),
+    ),
+    Prim_bad=(                          # Wrong type for primitive, including bool for Integer and Number
+        ('T-bool', ('True', 1)),
+        ('T-int', (35.4, True, 'hello')),
+        ('T-num', (True, 'hello')),
+        ('T-str', (True, 1)),
+    ),
+
+    Bag1=Counter((1, 4, 4, 9, 16)),     # Python Counter type is an unordered non-unique collection ("Bag")
+    Bag2=Counter((4, 9, 1, 16, 4)),
+    Bag3=Counter((9, 9, 1, 16, 4)),
+
+    B1b=b'data to be encoded',
+    B1s='ZGF0YSB0byBiZSBlbmNvZGVk',
+    B2b='data\nto be ëncoded 旅程'.encode(encoding='UTF-8'),
+    B2s='ZGF0YQp0byBiZSDDq25jb2RlZCDml4XnqIs',
+    B3b=bytes.fromhex('18e0c9987b8f32417ca6744f544b815ad2a6b4adca69d2c310bd033c57d363e3'),
+    B3s='GODJmHuPMkF8pnRPVEuBWtKmtK3KadLDEL0DPFfTY-M',
+    B_bad1b='string',
+    B_bad2b=394,
+    B_bad3b=True,
+    B_bad1s='ZgF%&0B++',
+
+    C1a={'f_str': 'foo'},   # Choice - API keys are names
+    C2a={'f_bool': False},
+    C3a={'f_int': 42},
+    C1m={1: 'foo'},
+    C2m={4: False},
+    C3m={7: 42},
+    C1_bad1a={'f_str': 15},
+    C1_bad2a={'type5': 'foo'},
+    C1_bad3a={'f_str': 'foo', 'f_bool': False},
+    C1_bad1m={1: 15},
+    C1_bad2m={3: 'foo'},
+    C1_bad3m={1: 'foo', '4': False},
+    C1_bad4m={'one': 'foo'},
+
+    Cc1a={1: 'foo'},        # Choice.ID - API keys are IDs
+    Cc2a={4: False},
+    Cc3a={7: 42},
+    Cc1m={1: 'foo'},
+    Cc2m={4: False},
+    Cc3m={7: 42},
+    Cc1_bad1a={1: 15},
+    Cc1_bad2a={8: 'foo'},
+    Cc1_bad3a={1: 'foo', 4: False},
+    Cc1_bad1m={1: 15},
+    Cc1_bad2m={3: 'foo'},
+    Cc1_bad3m={1: 'foo', '4': False},
+    Cc1_bad4m={'one': 'foo'},
+
+    RGB1={'red': 24, 'green': 120, 'blue': 240},     # API (decoded) and verbose values Map and Record
+    RGB2={'red': 50, 'blue': 100},
+    RGB3={'red': 9, 'green': 80, 'blue': 96, 'alpha': 128},
+    RGB_bad1a={'red': 24, 'green': 120},
+    RGB_bad2a={'red': 9, 'green': 80, 'blue': 96, 'beta': 128},
+    RGB_bad3a={'red': 9, 'green': 80, 'blue': 96, 'alpha': 128, 'beta': 196},
+    RGB_bad4a={'red': 'four', 'green': 120, 'blue': 240},
+    RGB_bad5a={'red': 24, 'green': '120', 'blue': 240},
+    RGB_bad6a={'red': 24, 'green': 120, 'bleu': 240},
+    RGB_bad7a={'1': 24, 'green': 120, 'blue': 240},
+    RGB_bad8a={1: 24, 'green': 120, 'blue': 240},
+
+    Map1m={2: 24, 4: 120, 6: 240},                   # Encoded values Map (minimized and dict/tag mode)
+    Map2m={2: 50, 6: 100},
+    Map3m={2: 9, 4: 80, 6: 96, 9: 128},
+    Map_bad1m={2: 24, 4: 120},
+    Map_bad2m={2: 9, 4: 80, 6: 96, 9: 128, 12: 42},
+    Map_bad3m={2: 'four', 4: 120, 6: 240},
+    Map_bad4m={'two': 24, 4: 120, 6: 240},
+    Map_bad5m=[24, 120, 240],
+
+    Rec1m=[24, 120, 240],                           # Encoded values Record (minimized) and API+encoded Array values
+    Rec2m=[50, None, 100],
+    Rec3m=[9, 80, 96, 128],
+    Rec_bad1m=[24, 120],
+    Rec_bad2m=[9, 80, 96, 128, 42],
+    Rec_bad3m=['four', 120, 240],
+
+    Rec1n={1: 24, 2: 120, 3: 240},                   # Encoded values Record (unused dict/tag mode)
+    Rec2n={1: 50, 3: 100},
+    Rec3n={1: 9, 2: 80, 3: 96, 4: 128},
+    Rec_bad1n={1: 24, 2: 120},
+    Rec_bad2n={1: 9, 2: 80, 3: 96, 4: 128, 5: 42},
+    Rec_bad3n={1: 'four', 2: 120, 3: 240},
+    Rec_bad4n={'one': 24, 2: 120, 3: 240},
+
+    RGB1c=[24, 120, 240],                            # Encoded values Record (concise)
+    RGB2c=[50, None, 100],
+    RGB3c=[9, 80, 96, 128],
+    RGB_bad1c=[24, 120],
+    RGB_bad2c=[9, 80, 96, 128, 42],
+    RGB_bad3c=['four', 120, 240],
+
+    Arr1=[None, 3, 2],
+    Arr2=[True, 3, 2.71828, 'Red'],
+    Arr3=[True, 3, 2, 'Red', [1, 'Blue'], [2, 3]],
+    Arr4=[True, 3, 2.71828, None, [1, 'Blue'], [2, 3]],
+    Arr5=[True, 3, 2.71828, 'Red', None, []],
+    Arr_bad1=[True, 3, None, 'Red'],                    # Third element is required
+    Arr_bad2=[True, 3, False, 'Red'],                   # Third element is Number
+    Arr_bad3=[True, 3, 2.71828, 'Red', []],             # Optional arrays are omitted, not empty
+)
+_F.RGB_bad_api = tuple(getattr(_F, f'RGB_bad{n}a') for n in range(1, 8))     # Bad API values in all record modes
+_F.Rec_bad_m = (_F.Rec_bad1m, _F.Rec_bad2m, _F.Rec_bad3m)
+_F.Arr_bad = (_F.Arr_bad1, _F.Arr_bad2, _F.Arr_bad3)
+_F.Arr_pairs = tuple((a, a) for a in (_F.Arr1, _F.Arr2, _F.Arr3, _F.Arr4, _F.Arr5))   # Arrays serialize as themselves
+_F.Rec_m_pairs = tuple((r, r) for r in (_F.Rec1m, _F.Rec2m, _F.Rec3m))
+
+# Each good RGB value in every serialization: API (and verbose), Map min, Record min, Record unused, Record concise
+RGBCase = namedtuple('RGBCase', 'api map_m rec_m rec_n rec_c')
+_F.RGB_good = tuple(RGBCase(*(getattr(_F, f.format(n)) for f in ('RGB{}', 'Map{}m', 'Rec{}m', 'Rec{}n', 'RGB{}c')))
+                    for n in (1, 2, 3))
+_F.RGB_bad_verbose = _F.RGB_bad_api + (_F.RGB_bad8a,)
+_F.Map_bad_m = (_F.Map_bad1m, _F.Map_bad2m, _F.Map_bad3m, _F.Map_bad4m, _F.Map_bad5m)
+_F.Rec_bad_n = (_F.Rec_bad1n, _F.Rec_bad2n, _F.Rec_bad3n, _F.Rec_bad4n)
+_F.RGB_bad_c = (_F.RGB_bad1c, _F.RGB_bad2c, _F.RGB_bad3c)
+
+
 class BasicTypes(unittest.TestCase):
+    longMessage = False     # Smoke tests: default failure messages are enough
+
     schema = {                # JADN schema for datatypes used in Basic Types tests
         'types': [
             ['T-bool', 'Boolean', [], ''],
@@ -63,6 +289,10 @@ class BasicTypes(unittest.TestCase):
                 [6, 'blue', 'Integer', [], ''],
                 [9, 'alpha', 'Integer', ['[0'], '']
             ]],
+            ['T-map-id', 'Map', ['='], '', [            # Map.ID - serialized keys are tags in every mode
+                [2, 'red', 'Integer', [], ''],
+                [4, 'green', 'Integer', ['[0'], '']
+            ]],
             ['T-arr-rgba', 'Array', [], '', [
                 [1, 'red', 'Integer', [], ''],
                 [2, 'green', 'Integer', ['[0'], ''],
@@ -77,691 +307,200 @@ class BasicTypes(unittest.TestCase):
             ]]
         ]}
 
+    # One codec per encoding mode, shared by all tests and built when first used
+    codec_ff = _LazyCodec(verbose_rec=False, verbose_str=False)
+    codec_ft = _LazyCodec(verbose_rec=False, verbose_str=True)
+    codec_tf = _LazyCodec(verbose_rec=True, verbose_str=False)
+    codec_tt = _LazyCodec(verbose_rec=True, verbose_str=True)
+
     def setUp(self):
-        jadn.check(self.schema)
-        self.tc = jadn.codec.Codec(self.schema, verbose_rec=False, verbose_str=False)
+        self.tc = self.codec_ff
 
     def test_primitive(self):   # Non-composed types (bool, int, num, str)
-        self.assertEqual(self.tc.decode('T-bool', True), True)
-        self.assertEqual(self.tc.decode('T-bool', False), False)
-        self.assertEqual(self.tc.encode('T-bool', True), True)
-        self.assertEqual(self.tc.encode('T-bool', False), False)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-bool', 'True')
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-bool', 1)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-bool', 'True')
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-bool', 1)
-
-        self.assertEqual(self.tc.decode('T-int', 35), 35)
-        self.assertEqual(self.tc.encode('T-int', 35), 35)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-int', 35.4)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-int', True)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-int', 'hello')
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-int', 35.4)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-int', True)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-int', 'hello')
-
-        self.assertEqual(self.tc.decode('T-num', 25.96), 25.96)
-        self.assertEqual(self.tc.decode('T-num', 25), 25)
-        self.assertEqual(self.tc.encode('T-num', 25.96), 25.96)
-        self.assertEqual(self.tc.encode('T-num', 25), 25)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-num', True)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-num', 'hello')
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-num', True)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-num', 'hello')
-
-        self.assertEqual(self.tc.decode('T-str', 'parrot'), 'parrot')
-        self.assertEqual(self.tc.encode('T-str', 'parrot'), 'parrot')
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-str', True)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-str', 1)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-str', True)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-str', 1)
+        decode, encode = self.tc.decode, self.tc.encode
+        for t, good in _F.Prim_good:    # Primitives pass through the codec unchanged, as the same object
+            for v in good:
+                self.assertIs(decode(t, v), v)
+                self.assertIs(encode(t, v), v)
+        for t, bads in _F.Prim_bad:
+            for v in bads:
+                with self.subTest(t=t, v=v):
+                    _must_raise(self, decode, t, v)
+                    _must_raise(self, encode, t, v)
 
     def test_arrayof(self):                 # ordered, non-unique
-        self.assertEqual(self.tc.decode('T-arrayof', [1, 4, 4, 16]), [1, 4, 4, 16])
-        self.assertEqual(self.tc.encode('T-arrayof', [1, 4, 4, 16]), [1, 4, 4, 16])
-        self.assertNotEqual(self.tc.decode('T-arrayof', [1, 4, 9, 16]), [4, 9, 1, 16])
-        self.assertNotEqual(self.tc.encode('T-arrayof', [1, 4, 9, 16]), [4, 9, 1, 16])
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-arrayof', [1, '4', 4, 16])
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-arrayof', 9)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-arrayof', [1, '4', 4, 16])
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-arrayof', 9)
+        for op in (self.tc.decode, self.tc.encode):
+            with self.subTest(op=op.__name__):
+                self.assertEqual(op('T-arrayof', [1, 4, 4, 16]), [1, 4, 4, 16])
+                self.assertNotEqual(op('T-arrayof', [1, 4, 9, 16]), [4, 9, 1, 16])
+                _must_raise(self, op, 'T-arrayof', [1, '4', 4, 16])
+                _must_raise(self, op, 'T-arrayof', 9)
 
     def test_arrayof_unique(self):          # ordered, unique
-        self.assertEqual(self.tc.decode('T-arrayof-unique', [1, 4, 9, 16]), [1, 4, 9, 16])
-        self.assertEqual(self.tc.encode('T-arrayof-unique', [1, 4, 9, 16]), [1, 4, 9, 16])
-        self.assertNotEqual(self.tc.decode('T-arrayof-unique', [1, 4, 9, 16]), [4, 9, 1, 16])
-        self.assertNotEqual(self.tc.encode('T-arrayof-unique', [1, 4, 9, 16]), [4, 9, 1, 16])
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-arrayof-unique', [1, 4, 4, 16])
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-arrayof-unique', [1, 4, 4, 16])
+        for op in (self.tc.decode, self.tc.encode):
+            with self.subTest(op=op.__name__):
+                self.assertEqual(op('T-arrayof-unique', [1, 4, 9, 16]), [1, 4, 9, 16])
+                self.assertNotEqual(op('T-arrayof-unique', [1, 4, 9, 16]), [4, 9, 1, 16])
+                _must_raise(self, op, 'T-arrayof-unique', [1, 4, 4, 16])
 
     def test_arrayof_set(self):             # unordered, unique
-        self.assertEqual(self.tc.decode('T-arrayof-set', [1, 4, 9, 16]), [1, 4, 9, 16])
-        self.assertEqual(self.tc.encode('T-arrayof-set', [1, 4, 9, 16]), [1, 4, 9, 16])
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-arrayof-set', [1, 4, 4, 16])
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-arrayof-set', [1, 4, 4, 16])
+        for op in (self.tc.decode, self.tc.encode):
+            with self.subTest(op=op.__name__):
+                self.assertEqual(op('T-arrayof-set', [1, 4, 9, 16]), [1, 4, 9, 16])
+                _must_raise(self, op, 'T-arrayof-set', [1, 4, 4, 16])
 
     def test_arrayof_unordered(self):       # unordered, non-unique
-        self.assertEqual(self.tc.decode('T-arrayof-unordered', [1, 4, 9, 16]), [1, 4, 9, 16])
-        self.assertEqual(self.tc.encode('T-arrayof-unordered', [1, 4, 9, 16]), [1, 4, 9, 16])
+        for op in (self.tc.decode, self.tc.encode):
+            with self.subTest(op=op.__name__):
+                self.assertEqual(op('T-arrayof-unordered', [1, 4, 9, 16]), [1, 4, 9, 16])
         # Codec does not do value comparison so it cannot validate unordered behavior
-        # Python Counter type is an unordered non-unique collection ("Bag")
-        self.assertEqual(Counter([1, 4, 4, 9, 16]), Counter([4, 9, 1, 16, 4]))
-        self.assertNotEqual(Counter([1, 4, 4, 9, 16]), Counter([9, 9, 1, 16, 4]))
-
-    B1b = b'data to be encoded'
-    B1s = 'ZGF0YSB0byBiZSBlbmNvZGVk'
-    B2b = 'data\nto be ëncoded 旅程'.encode(encoding='UTF-8')
-    B2s = 'ZGF0YQp0byBiZSDDq25jb2RlZCDml4XnqIs'
-    B3b = binascii.a2b_hex('18e0c9987b8f32417ca6744f544b815ad2a6b4adca69d2c310bd033c57d363e3')
-    B3s = 'GODJmHuPMkF8pnRPVEuBWtKmtK3KadLDEL0DPFfTY-M'
-    B_bad1b = 'string'
-    B_bad2b = 394
-    B_bad3b = True
-    B_bad1s = 'ZgF%&0B++'
+        self.assertEqual(_F.Bag1, _F.Bag2)
+        self.assertNotEqual(_F.Bag1, _F.Bag3)
 
     def test_binary(self):
-        self.assertEqual(self.tc.decode('T-bin', self.B1s), self.B1b)
-        self.assertEqual(self.tc.decode('T-bin', self.B2s), self.B2b)
-        self.assertEqual(self.tc.decode('T-bin', self.B3s), self.B3b)
-        self.assertEqual(self.tc.encode('T-bin', self.B1b), self.B1s)
-        self.assertEqual(self.tc.encode('T-bin', self.B2b), self.B2s)
-        self.assertEqual(self.tc.encode('T-bin', self.B3b), self.B3s)
-        with self.assertRaises((TypeError, binascii.Error)):
-            self.tc.decode('T-bin', self.B_bad1s)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-bin', self.B_bad1b)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-bin', self.B_bad2b)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-bin', self.B_bad3b)
-
-    C1a = {'f_str': 'foo'}  # Choice - API keys are names
-    C2a = {'f_bool': False}
-    C3a = {'f_int': 42}
-    C1m = {1: 'foo'}
-    C2m = {4: False}
-    C3m = {7: 42}
-    C1_bad1a = {'f_str': 15}
-    C1_bad2a = {'type5': 'foo'}
-    C1_bad3a = {'f_str': 'foo', 'f_bool': False}
-    C1_bad1m = {1: 15}
-    C1_bad2m = {3: 'foo'}
-    C1_bad3m = {1: 'foo', '4': False}
-    C1_bad4m = {'one': 'foo'}
-
-    Cc1a = {1: 'foo'}       # Choice.ID - API keys are IDs
-    Cc2a = {4: False}
-    Cc3a = {7: 42}
-    Cc1m = {1: 'foo'}
-    Cc2m = {4: False}
-    Cc3m = {7: 42}
-    Cc1_bad1a = {1: 15}
-    Cc1_bad2a = {8: 'foo'}
-    Cc1_bad3a = {1: 'foo', 4: False}
-    Cc1_bad1m = {1: 15}
-    Cc1_bad2m = {3: 'foo'}
-    Cc1_bad3m = {1: 'foo', '4': False}
-    Cc1_bad4m = {'one': 'foo'}
+        enc, dec = self.tc.encode, self.tc.decode
+        for bval, sval in ((_F.B1b, _F.B1s), (_F.B2b, _F.B2s), (_F.B3b, _F.B3s)):
+            with self.subTest(sval=sval):
+                self.assertEqual(dec('T-bin', sval), bval)
+                self.assertEqual(enc('T-bin', bval), sval)
+        _must_raise(self, dec, 'T-bin', _F.B_bad1s, exc=(TypeError, binascii.Error))
+        for bad in (_F.B_bad1b, _F.B_bad2b, _F.B_bad3b):
+            with self.subTest(bad=bad):
+                _must_raise(self, enc, 'T-bin', bad)
+
+    def _check_choice_min(self, t, pairs, bad_api, bad_min):     # pairs: (API value, minimized value)
+        for aval, mval in pairs:
+            self.assertEqual(self.tc.encode(t, aval), mval)
+            self.assertEqual(self.tc.decode(t, mval), aval)
+            self.assertEqual(self.tc.decode(t, _j(mval)), aval)
+        _raises_all(self, self.tc.encode, t, bad_api)
+        _raises_all(self, self.tc.decode, t, bad_min)
 
     def test_choice_min(self):
-        self.assertEqual(self.tc.encode('T-choice', self.C1a), self.C1m)
-        self.assertEqual(self.tc.decode('T-choice', self.C1m), self.C1a)
-        self.assertEqual(self.tc.decode('T-choice', _j(self.C1m)), self.C1a)
-        self.assertEqual(self.tc.encode('T-choice', self.C2a), self.C2m)
-        self.assertEqual(self.tc.decode('T-choice', self.C2m), self.C2a)
-        self.assertEqual(self.tc.decode('T-choice', _j(self.C2m)), self.C2a)
-        self.assertEqual(self.tc.encode('T-choice', self.C3a), self.C3m)
-        self.assertEqual(self.tc.decode('T-choice', self.C3m), self.C3a)
-        self.assertEqual(self.tc.decode('T-choice', _j(self.C3m)), self.C3a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-choice', self.C1_bad1a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-choice', self.C1_bad2a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-choice', self.C1_bad3a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-choice', self.C1_bad1m)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-choice', self.C1_bad2m)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-choice', self.C1_bad3m)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-choice', self.C1_bad4m)
+        self._check_choice_min(
+            'T-choice',
+            ((_F.C1a, _F.C1m), (_F.C2a, _F.C2m), (_F.C3a, _F.C3m)),
+            (_F.C1_bad1a, _F.C1_bad2a, _F.C1_bad3a),
+            (_F.C1_bad1m, _F.C1_bad2m, _F.C1_bad3m, _F.C1_bad4m))
 
     def test_choice_verbose(self):
-        self.tc.set_mode(verbose_rec=True, verbose_str=True)
-        self.assertEqual(self.tc.encode('T-choice', self.C1a), self.C1a)
-        self.assertEqual(self.tc.decode('T-choice', self.C1a), self.C1a)
-        self.assertEqual(self.tc.encode('T-choice', self.C2a), self.C2a)
-        self.assertEqual(self.tc.decode('T-choice', self.C2a), self.C2a)
-        self.assertEqual(self.tc.encode('T-choice', self.C3a), self.C3a)
-        self.assertEqual(self.tc.decode('T-choice', self.C3a), self.C3a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-choice', self.C1_bad1a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-choice', self.C1_bad2a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-choice', self.C1_bad3a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-choice', self.C1_bad1a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-choice', self.C1_bad2a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-choice', self.C1_bad3a)
+        self.tc = self.codec_tt
+        enc, dec = self.tc.encode, self.tc.decode
+        _idem(self, self.tc, 'T-choice', _F.C1a)
+        _idem(self, self.tc, 'T-choice', _F.C2a)
+        _idem(self, self.tc, 'T-choice', _F.C3a)
+        _raises_all(self, enc, 'T-choice', (_F.C1_bad1a, _F.C1_bad2a, _F.C1_bad3a))
+        _raises_all(self, dec, 'T-choice', (_F.C1_bad1a, _F.C1_bad2a, _F.C1_bad3a))
 
     def test_choice_id_min(self):
-        self.assertEqual(self.tc.encode('T-choice-id', self.Cc1a), self.Cc1m)
-        self.assertEqual(self.tc.decode('T-choice-id', self.Cc1m), self.Cc1a)
-        self.assertEqual(self.tc.decode('T-choice-id', _j(self.Cc1m)), self.Cc1a)
-        self.assertEqual(self.tc.encode('T-choice-id', self.Cc2a), self.Cc2m)
-        self.assertEqual(self.tc.decode('T-choice-id', self.Cc2m), self.Cc2a)
-        self.assertEqual(self.tc.decode('T-choice-id', _j(self.Cc2m)), self.Cc2a)
-        self.assertEqual(self.tc.encode('T-choice-id', self.Cc3a), self.Cc3m)
-        self.assertEqual(self.tc.decode('T-choice-id', self.Cc3m), self.Cc3a)
-        self.assertEqual(self.tc.decode('T-choice-id', _j(self.Cc3m)), self.Cc3a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-choice-id', self.Cc1_bad1a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-choice-id', self.Cc1_bad2a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-choice-id', self.Cc1_bad3a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-choice-id', self.Cc1_bad1m)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-choice-id', self.Cc1_bad2m)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-choice-id', self.Cc1_bad3m)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-choice-id', self.Cc1_bad4m)
+        self._check_choice_min(
+            'T-choice-id',
+            ((_F.Cc1a, _F.Cc1m), (_F.Cc2a, _F.Cc2m), (_F.Cc3a, _F.Cc3m)),
+            (_F.Cc1_bad1a, _F.Cc1_bad2a, _F.Cc1_bad3a),
+            (_F.Cc1_bad1m, _F.Cc1_bad2m, _F.Cc1_bad3m, _F.Cc1_bad4m))
 
     def test_choice_id_verbose(self):
-        self.tc.set_mode(verbose_rec=True, verbose_str=True)
-        self.assertEqual(self.tc.encode('T-choice-id', self.Cc1a), self.Cc1a)
-        self.assertEqual(self.tc.decode('T-choice-id', self.Cc1a), self.Cc1a)
-        self.assertEqual(self.tc.encode('T-choice-id', self.Cc2a), self.Cc2a)
-        self.assertEqual(self.tc.decode('T-choice-id', self.Cc2a), self.Cc2a)
-        self.assertEqual(self.tc.encode('T-choice-id', self.Cc3a), self.Cc3a)
-        self.assertEqual(self.tc.decode('T-choice-id', self.Cc3a), self.Cc3a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-choice-id', self.Cc1_bad1a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-choice-id', self.Cc1_bad2a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-choice-id', self.Cc1_bad3a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-choice-id', self.Cc1_bad1a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-choice-id', self.Cc1_bad2a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-choice-id', self.Cc1_bad3a)
+        self.tc = self.codec_tt
+        enc, dec = self.tc.encode, self.tc.decode
+        _idem(self, self.tc, 'T-choice-id', _F.Cc1a)
+        _idem(self, self.tc, 'T-choice-id', _F.Cc2a)
+        _idem(self, self.tc, 'T-choice-id', _F.Cc3a)
+        _raises_all(self, enc, 'T-choice-id', (_F.Cc1_bad1a, _F.Cc1_bad2a, _F.Cc1_bad3a))
+        _raises_all(self, dec, 'T-choice-id', (_F.Cc1_bad1a, _F.Cc1_bad2a, _F.Cc1_bad3a))
+
+    def _check_enumerated(self, t, aval, sval, bad_api, bad_enc):    # aval: API value, sval: serialized value
+        self.assertEqual(self.tc.encode(t, aval), sval)
+        self.assertEqual(self.tc.decode(t, sval), aval)
+        _raises_all(self, self.tc.encode, t, bad_api)
+        _raises_all(self, self.tc.decode, t, bad_enc)
 
     def test_enumerated_min(self):
-        self.assertEqual(self.tc.encode('T-enum', 'extra'), 15)
-        self.assertEqual(self.tc.decode('T-enum', 15), 'extra')
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-enum', 'foo')
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-enum', 15)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-enum', [1])
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-enum', 13)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-enum', 'extra')
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-enum', ['first'])
+        self._check_enumerated('T-enum', 'extra', 15, ('foo', 15, [1]), (13, 'extra', ['first']))
 
     def test_enumerated_verbose(self):
-        self.tc.set_mode(verbose_rec=True, verbose_str=True)
-        self.assertEqual(self.tc.encode('T-enum', 'extra'), 'extra')
-        self.assertEqual(self.tc.decode('T-enum', 'extra'), 'extra')
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-enum', 'foo')
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-enum', 42)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-enum', ['first'])
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-enum', 'foo')
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-enum', 42)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-enum', ['first'])
+        self.tc = self.codec_tt
+        self._check_enumerated('T-enum', 'extra', 'extra', ('foo', 42, ['first']), ('foo', 42, ['first']))
 
     def test_enumerated_id_min(self):
-        self.assertEqual(self.tc.encode('T-enum-c', 15), 15)
-        self.assertEqual(self.tc.decode('T-enum-c', 15), 15)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-enum-c', 'extra')
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-enum-c', 'extra')
+        self._check_enumerated('T-enum-c', 15, 15, ('extra',), ('extra',))
 
     def test_enumerated_id_verbose(self):
-        self.tc.set_mode(verbose_rec=True, verbose_str=True)
-        self.assertEqual(self.tc.encode('T-enum-c', 15), 15)
-        self.assertEqual(self.tc.decode('T-enum-c', 15), 15)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-enum-c', 'extra')
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-enum-c', 'extra')
-
-    RGB1 = {'red': 24, 'green': 120, 'blue': 240}    # API (decoded) and verbose values Map and Record
-    RGB2 = {'red': 50, 'blue': 100}
-    RGB3 = {'red': 9, 'green': 80, 'blue': 96, 'alpha': 128}
-    RGB_bad1a = {'red': 24, 'green': 120}
-    RGB_bad2a = {'red': 9, 'green': 80, 'blue': 96, 'beta': 128}
-    RGB_bad3a = {'red': 9, 'green': 80, 'blue': 96, 'alpha': 128, 'beta': 196}
-    RGB_bad4a = {'red': 'four', 'green': 120, 'blue': 240}
-    RGB_bad5a = {'red': 24, 'green': '120', 'blue': 240}
-    RGB_bad6a = {'red': 24, 'green': 120, 'bleu': 240}
-    RGB_bad7a = {'1': 24, 'green': 120, 'blue': 240}
-    RGB_bad8a = {1: 24, 'green': 120, 'blue': 240}
-
-    Map1m = {2: 24, 4: 120, 6: 240}                  # Encoded values Map (minimized and dict/tag mode)
-    Map2m = {2: 50, 6: 100}
-    Map3m = {2: 9, 4: 80, 6: 96, 9: 128}
-    Map_bad1m = {2: 24, 4: 120}
-    Map_bad2m = {2: 9, 4: 80, 6: 96, 9: 128, 12: 42}
-    Map_bad3m = {2: 'four', 4: 120, 6: 240}
-    Map_bad4m = {'two': 24, 4: 120, 6: 240}
-    Map_bad5m = [24, 120, 240]
-
-    Rec1m = [24, 120, 240]                          # Encoded values Record (minimized) and API+encoded Array values
-    Rec2m = [50, None, 100]
-    Rec3m = [9, 80, 96, 128]
-    Rec_bad1m = [24, 120]
-    Rec_bad2m = [9, 80, 96, 128, 42]
-    Rec_bad3m = ['four', 120, 240]
-
-    Rec1n = {1: 24, 2: 120, 3: 240}                  # Encoded values Record (unused dict/tag mode)
-    Rec2n = {1: 50, 3: 100}
-    Rec3n = {1: 9, 2: 80, 3: 96, 4: 128}
-    Rec_bad1n = {1: 24, 2: 120}
-    Rec_bad2n = {1: 9, 2: 80, 3: 96, 4: 128, 5: 42}
-    Rec_bad3n = {1: 'four', 2: 120, 3: 240}
-    Rec_bad4n = {'one': 24, 2: 120, 3: 240}
-
-    RGB1c = [24, 120, 240]                           # Encoded values Record (concise)
-    RGB2c = [50, None, 100]
-    RGB3c = [9, 80, 96, 128]
-    RGB_bad1c = [24, 120]
-    RGB_bad2c = [9, 80, 96, 128, 42]
-    RGB_bad3c = ['four', 120, 240]
+        self.tc = self.codec_tt
+        self._check_enumerated('T-enum-c', 15, 15, ('extra',), ('extra',))
 
     def test_map_min(self):             # dict structure, identifier tag
-        self.assertDictEqual(self.tc.encode('T-map-rgba', self.RGB1), self.Map1m)
-        self.assertDictEqual(self.tc.decode('T-map-rgba', self.Map1m), self.RGB1)
-        self.assertDictEqual(self.tc.decode('T-map-rgba', _j(self.Map1m)), self.RGB1)
-        self.assertDictEqual(self.tc.encode('T-map-rgba', self.RGB2), self.Map2m)
-        self.assertDictEqual(self.tc.decode('T-map-rgba', self.Map2m), self.RGB2)
-        self.assertDictEqual(self.tc.decode('T-map-rgba', _j(self.Map2m)), self.RGB2)
-        self.assertDictEqual(self.tc.encode('T-map-rgba', self.RGB3), self.Map3m)
-        self.assertDictEqual(self.tc.decode('T-map-rgba', self.Map3m), self.RGB3)
-        self.assertDictEqual(self.tc.decode('T-map-rgba', _j(self.Map3m)), self.RGB3)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad1a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad2a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad3a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad4a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad5a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad6a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad7a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-map-rgba', self.Map_bad1m)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-map-rgba', self.Map_bad2m)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-map-rgba', self.Map_bad3m)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-map-rgba', self.Map_bad4m)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-map-rgba', self.Map_bad5m)
+        self._check_roundtrip('T-map-rgba', [(c.api, c.map_m) for c in _F.RGB_good], _F.RGB_bad_api, _F.Map_bad_m,
+                              json_rt=True)
 
     def test_map_unused(self):         # dict structure, identifier tag
-        self.tc.set_mode(verbose_rec=True, verbose_str=False)
-        self.assertDictEqual(self.tc.encode('T-map-rgba', self.RGB1), self.Map1m)
-        self.assertDictEqual(self.tc.decode('T-map-rgba', self.Map1m), self.RGB1)
-        self.assertDictEqual(self.tc.decode('T-map-rgba', _j(self.Map1m)), self.RGB1)
-        self.assertDictEqual(self.tc.encode('T-map-rgba', self.RGB2), self.Map2m)
-        self.assertDictEqual(self.tc.decode('T-map-rgba', self.Map2m), self.RGB2)
-        self.assertDictEqual(self.tc.decode('T-map-rgba', _j(self.Map2m)), self.RGB2)
-        self.assertDictEqual(self.tc.encode('T-map-rgba', self.RGB3), self.Map3m)
-        self.assertDictEqual(self.tc.decode('T-map-rgba', self.Map3m), self.RGB3)
-        self.assertDictEqual(self.tc.decode('T-map-rgba', _j(self.Map3m)), self.RGB3)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad1a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad2a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad3a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad4a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad5a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad6a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad7a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-map-rgba', self.Map_bad1m)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-map-rgba', self.Map_bad2m)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-map-rgba', self.Map_bad3m)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-map-rgba', self.Map_bad4m)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-map-rgba', _j(self.Map_bad4m))
+        self.tc = self.codec_tf
+        self._check_roundtrip('T-map-rgba', [(c.api, c.map_m) for c in _F.RGB_good], _F.RGB_bad_api,
+                              _F.Map_bad_m[:4] + (_j(_F.Map_bad4m),), json_rt=True)
 
     def test_map_concise(self):         # dict structure, identifier name
-        self.tc.set_mode(verbose_rec=False, verbose_str=True)
-        self.assertDictEqual(self.tc.encode('T-map-rgba', self.RGB1), self.RGB1)
-        self.assertDictEqual(self.tc.decode('T-map-rgba', self.RGB1), self.RGB1)
-        self.assertDictEqual(self.tc.encode('T-map-rgba', self.RGB2), self.RGB2)
-        self.assertDictEqual(self.tc.decode('T-map-rgba', self.RGB2), self.RGB2)
-        self.assertDictEqual(self.tc.encode('T-map-rgba', self.RGB3), self.RGB3)
-        self.assertDictEqual(self.tc.decode('T-map-rgba', self.RGB3), self.RGB3)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-map-rgba', self.RGB_bad1a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-map-rgba', self.RGB_bad2a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-map-rgba', self.RGB_bad3a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-map-rgba', self.RGB_bad4a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-map-rgba', self.RGB_bad5a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-map-rgba', self.RGB_bad6a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-map-rgba', self.RGB_bad7a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad1a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad2a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad3a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad4a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad5a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad6a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad7a)
+        self.tc = self.codec_ft
+        self._check_roundtrip('T-map-rgba', [(c.api, c.api) for c in _F.RGB_good], _F.RGB_bad_api, _F.RGB_bad_api)
 
     def test_map_verbose(self):     # dict structure, identifier name
-        self.tc.set_mode(verbose_rec=True, verbose_str=True)
-        self.assertDictEqual(self.tc.encode('T-map-rgba', self.RGB1), self.RGB1)
-        self.assertDictEqual(self.tc.decode('T-map-rgba', self.RGB1), self.RGB1)
-        self.assertDictEqual(self.tc.encode('T-map-rgba', self.RGB2), self.RGB2)
-        self.assertDictEqual(self.tc.decode('T-map-rgba', self.RGB2), self.RGB2)
-        self.assertDictEqual(self.tc.encode('T-map-rgba', self.RGB3), self.RGB3)
-        self.assertDictEqual(self.tc.decode('T-map-rgba', self.RGB3), self.RGB3)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad1a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad2a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad3a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad4a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad5a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad6a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad7a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-map-rgba', self.RGB_bad8a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-map-rgba', self.RGB_bad1a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-map-rgba', self.RGB_bad2a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-map-rgba', self.RGB_bad3a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-map-rgba', self.RGB_bad4a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-map-rgba', self.RGB_bad5a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-map-rgba', self.RGB_bad6a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-map-rgba', self.RGB_bad7a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-map-rgba', self.RGB_bad8a)
+        self.tc = self.codec_tt
+        self._check_roundtrip('T-map-rgba', [(c.api, c.api) for c in _F.RGB_good], _F.RGB_bad_verbose,
+                              _F.RGB_bad_verbose)
+
+    def test_map_id_verbose(self):      # dict structure, identifier tag even with verbose identifiers
+        for self.tc in (self.codec_ft, self.codec_tt):
+            self._check_roundtrip('T-map-id', [({'red': 1, 'green': 2}, {2: 1, 4: 2}), ({'red': 3}, {2: 3})],
+                                  ({'green': 2}, {'red': 1, 'blue': 3}), ({4: 2}, {'red': 1}), json_rt=True)
+
+    def _check_roundtrip(self, t, pairs, bad_api, bad_ser, json_rt=False):   # pairs: (API value, serialized value)
+        for aval, sval in pairs:
+            with self.subTest(t=t, val=aval):
+                if aval is sval and not json_rt:
+                    _idem(self, self.tc, t, aval)
+                    continue
+                self.assertEqual(self.tc.encode(t, aval), sval)
+                self.assertEqual(self.tc.decode(t, sval), aval)
+                if json_rt:
+                    self.assertEqual(self.tc.decode(t, _j(sval)), aval)
+        _raises_all(self, self.tc.encode, t, bad_api)
+        _raises_all(self, self.tc.decode, t, bad_ser)
 
     def test_record_min(self):
-        self.assertListEqual(self.tc.encode('T-rec-rgba', self.RGB1), self.Rec1m)
-        self.assertDictEqual(self.tc.decode('T-rec-rgba', self.Rec1m), self.RGB1)
-        self.assertListEqual(self.tc.encode('T-rec-rgba', self.RGB2), self.Rec2m)
-        self.assertDictEqual(self.tc.decode('T-rec-rgba', self.Rec2m), self.RGB2)
-        self.assertListEqual(self.tc.encode('T-rec-rgba', self.RGB3), self.Rec3m)
-        self.assertDictEqual(self.tc.decode('T-rec-rgba', self.Rec3m), self.RGB3)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad1a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad2a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad3a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad4a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad5a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad6a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad7a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-rec-rgba', self.Rec_bad1m)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-rec-rgba', self.Rec_bad2m)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-rec-rgba', self.Rec_bad3m)
+        self._check_roundtrip('T-rec-rgba', [(c.api, c.rec_m) for c in _F.RGB_good], _F.RGB_bad_api, _F.Rec_bad_m)
 
     def test_record_unused(self):
-        self.tc.set_mode(verbose_rec=True, verbose_str=False)
-        self.assertDictEqual(self.tc.encode('T-rec-rgba', self.RGB1), self.Rec1n)
-        self.assertDictEqual(self.tc.decode('T-rec-rgba', self.Rec1n), self.RGB1)
-        self.assertDictEqual(self.tc.decode('T-rec-rgba', _j(self.Rec1n)), self.RGB1)
-        self.assertDictEqual(self.tc.encode('T-rec-rgba', self.RGB2), self.Rec2n)
-        self.assertDictEqual(self.tc.decode('T-rec-rgba', self.Rec2n), self.RGB2)
-        self.assertDictEqual(self.tc.decode('T-rec-rgba', _j(self.Rec2n)), self.RGB2)
-        self.assertDictEqual(self.tc.encode('T-rec-rgba', self.RGB3), self.Rec3n)
-        self.assertDictEqual(self.tc.decode('T-rec-rgba', self.Rec3n), self.RGB3)
-        self.assertDictEqual(self.tc.decode('T-rec-rgba', _j(self.Rec3n)), self.RGB3)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad1a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad2a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad3a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad4a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad5a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad6a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad7a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-rec-rgba', self.Rec_bad1n)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-rec-rgba', self.Rec_bad2n)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-rec-rgba', self.Rec_bad3n)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-rec-rgba', self.Rec_bad4n)
+        self.tc = self.codec_tf
+        self._check_roundtrip('T-rec-rgba', [(c.api, c.rec_n) for c in _F.RGB_good], _F.RGB_bad_api, _F.Rec_bad_n,
+                              json_rt=True)
 
     def test_record_concise(self):
-        self.tc.set_mode(verbose_rec=False, verbose_str=True)
-        self.assertListEqual(self.tc.encode('T-rec-rgba', self.RGB1), self.RGB1c)
-        self.assertDictEqual(self.tc.decode('T-rec-rgba', self.RGB1c), self.RGB1)
-        self.assertListEqual(self.tc.encode('T-rec-rgba', self.RGB2), self.RGB2c)
-        self.assertDictEqual(self.tc.decode('T-rec-rgba', self.RGB2c), self.RGB2)
-        self.assertListEqual(self.tc.encode('T-rec-rgba', self.RGB3), self.RGB3c)
-        self.assertDictEqual(self.tc.decode('T-rec-rgba', self.RGB3c), self.RGB3)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad1a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad2a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad3a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad4a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad5a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad6a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad7a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-rec-rgba', self.RGB_bad1c)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-rec-rgba', self.RGB_bad2c)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-rec-rgba', self.RGB_bad3c)
+        self.tc = self.codec_ft
+        self._check_roundtrip('T-rec-rgba', [(c.api, c.rec_c) for c in _F.RGB_good], _F.RGB_bad_api, _F.RGB_bad_c)
 
     def test_record_verbose(self):
-        self.tc.set_mode(verbose_rec=True, verbose_str=True)
-        self.assertDictEqual(self.tc.encode('T-rec-rgba', self.RGB1), self.RGB1)
-        self.assertDictEqual(self.tc.decode('T-rec-rgba', self.RGB1), self.RGB1)
-        self.assertDictEqual(self.tc.encode('T-rec-rgba', self.RGB2), self.RGB2)
-        self.assertDictEqual(self.tc.decode('T-rec-rgba', self.RGB2), self.RGB2)
-        self.assertDictEqual(self.tc.encode('T-rec-rgba', self.RGB3), self.RGB3)
-        self.assertDictEqual(self.tc.decode('T-rec-rgba', self.RGB3), self.RGB3)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad1a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad2a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad3a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad4a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad5a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad6a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad7a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-rec-rgba', self.RGB_bad8a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-rec-rgba', self.RGB_bad1a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-rec-rgba', self.RGB_bad2a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-rec-rgba', self.RGB_bad3a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-rec-rgba', self.RGB_bad4a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-rec-rgba', self.RGB_bad5a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-rec-rgba', self.RGB_bad6a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-rec-rgba', self.RGB_bad7a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-rec-rgba', self.RGB_bad8a)
-
-    Arr1 = [None, 3, 2]
-    Arr2 = [True, 3, 2.71828, 'Red']
-    Arr3 = [True, 3, 2, 'Red', [1, 'Blue'], [2, 3]]
-    Arr4 = [True, 3, 2.71828, None, [1, 'Blue'], [2, 3]]
-    Arr5 = [True, 3, 2.71828, 'Red', None, []]
-    Arr_bad1 = [True, 3, None, 'Red']                   # Third element is required
-    Arr_bad2 = [True, 3, False, 'Red']                  # Third element is Number
-    Arr_bad3 = [True, 3, 2.71828, 'Red', []]            # Optional arrays are omitted, not empty
-
-    def test_array(self):
-
-        def ta():
-            self.assertListEqual(self.tc.encode('T-array', self.Arr1), self.Arr1)
-            self.assertListEqual(self.tc.decode('T-array', self.Arr1), self.Arr1)
-            self.assertListEqual(self.tc.encode('T-array', self.Arr2), self.Arr2)
-            self.assertListEqual(self.tc.decode('T-array', self.Arr2), self.Arr2)
-            self.assertListEqual(self.tc.encode('T-array', self.Arr3), self.Arr3)
-            self.assertListEqual(self.tc.decode('T-array', self.Arr3), self.Arr3)
-            self.assertListEqual(self.tc.encode('T-array', self.Arr4), self.Arr4)
-            self.assertListEqual(self.tc.decode('T-array', self.Arr4), self.Arr4)
-            self.assertListEqual(self.tc.encode('T-array', self.Arr5), self.Arr5)
-            self.assertListEqual(self.tc.decode('T-array', self.Arr5), self.Arr5)
-            with self.assertRaises(ValueError):
-                self.tc.encode('T-array', self.Arr_bad1)
-            with self.assertRaises(ValueError):
-                self.tc.decode('T-array', self.Arr_bad1)
-            with self.assertRaises(ValueError):
-                self.tc.encode('T-array', self.Arr_bad2)
-            with self.assertRaises(ValueError):
-                self.tc.decode('T-array', self.Arr_bad2)
-            with self.assertRaises(ValueError):
-                self.tc.encode('T-array', self.Arr_bad3)
-            with self.assertRaises(ValueError):
-                self.tc.decode('T-array', self.Arr_bad3)
-
-            self.assertListEqual(self.tc.encode('T-arr-rgba', self.Rec1m), self.Rec1m)
-            self.assertListEqual(self.tc.decode('T-arr-rgba', self.Rec1m), self.Rec1m)
-            self.assertListEqual(self.tc.encode('T-arr-rgba', self.Rec2m), self.Rec2m)
-            self.assertListEqual(self.tc.decode('T-arr-rgba', self.Rec2m), self.Rec2m)
-            self.assertListEqual(self.tc.encode('T-arr-rgba', self.Rec3m), self.Rec3m)
-            self.assertListEqual(self.tc.decode('T-arr-rgba', self.Rec3m), self.Rec3m)
-            with self.assertRaises(ValueError):
-                self.tc.encode('T-arr-rgba', self.Rec_bad1m)
-            with self.assertRaises(ValueError):
-                self.tc.decode('T-arr-rgba', self.Rec_bad1m)
-            with self.assertRaises(ValueError):
-                self.tc.encode('T-arr-rgba', self.Rec_bad2m)
-            with self.assertRaises(ValueError):
-                self.tc.decode('T-arr-rgba', self.Rec_bad2m)
-            with self.assertRaises(ValueError):
-                self.tc.encode('T-arr-rgba', self.Rec_bad3m)
-            with self.assertRaises(ValueError):
-                self.tc.decode('T-arr-rgba', self.Rec_bad3m)
-
-        # Ensure that mode has no effect on array serialization
-
-        self.tc.set_mode(verbose_rec=False, verbose_str=False)
-        ta()
-        self.tc.set_mode(verbose_rec=False, verbose_str=True)
-        ta()
-        self.tc.set_mode(verbose_rec=True, verbose_str=False)
-        ta()
-        self.tc.set_mode(verbose_rec=True, verbose_str=True)
-        ta()
+        self.tc = self.codec_tt
+        self._check_roundtrip('T-rec-rgba', [(c.api, c.api) for c in _F.RGB_good], _F.RGB_bad_verbose,
+                              _F.RGB_bad_verbose)
+
+    def test_array(self):       # Ensure that mode has no effect on array serialization
+        for mode in ('ff', 'ft', 'tf', 'tt'):
+            with self.subTest(mode=mode):
+                self.tc = getattr(self, f'codec_{mode}')
+                self._check_roundtrip('T-array', _F.Arr_pairs, _F.Arr_bad, _F.Arr_bad)
+                self._check_roundtrip('T-arr-rgba', _F.Rec_m_pairs, _F.Rec_bad_m, _F.Rec_bad_m)
+
+    @unittest.skipUnless('JADN_BENCH' in os.environ, 'set JADN_BENCH to run timing checks')
+    def test_bench_rgb(self):   # Coarse guard against encode/decode slowdowns, not a precise benchmark
+        enc, dec = self.codec_tt.encode, self.codec_tt.decode
+        n = 10000
+        t0 = time.perf_counter()
+        for _ in range(n):
+            dec('T-rec-rgba', enc('T-rec-rgba', _F.RGB1))
+        self.assertLess(time.perf_counter() - t0, 2.0)
 
 
 class Compound(unittest.TestCase):  # TODO: arrayOf(rec,map,array,arrayof,choice), array(), map(), rec()
+    longMessage = False     # Smoke tests: default failure messages are enough
+
     schema = {
         'types': [
             ['T-choice', 'Choice', [], '', [
@@ -788,26 +527,29 @@ class Compound(unittest.TestCase):  # TODO: arrayOf(rec,map,array,arrayof,choice
             ]],
         ]}
 
+    codec_min = _LazyCodec()        # Codecs for the encoding modes used by the tests, built when first used
+    codec_verbose = _LazyCodec(verbose_rec=True, verbose_str=True)
+
     def setUp(self):
-        jadn.check(self.schema)
-        self.tc = jadn.codec.Codec(self.schema)
+        self.tc = self.codec_min
 
     C4a = {'rec': {'a': 1, 'b': 'c'}}
     C4m = {10: [1, 'c']}
 
     def test_choice_rec_verbose(self):
-        self.tc.set_mode(verbose_rec=True, verbose_str=True)
-        self.assertEqual(self.tc.decode('T-choice', self.C4a), self.C4a)
-        self.assertEqual(self.tc.encode('T-choice', self.C4a), self.C4a)
+        self.tc = self.codec_verbose
+        _idem(self, self.tc, 'T-choice', self.C4a)
 
     def test_choice_rec_min(self):
-        self.tc.set_mode(verbose_rec=False, verbose_str=False)
+        self.tc = self.codec_min
         self.assertEqual(self.tc.decode('T-choice', self.C4m), self.C4a)
         self.assertEqual(self.tc.encode('T-choice', self.C4a), self.C4m)
 
 
-class Selectors(unittest.TestCase):         # TODO: bad schema - verify * field has only Choice type
+class Selectors(_CaseTable):         # TODO: bad schema - verify * field has only Choice type
                                             # TODO: add test cases to decode multiple values for Choice (bad)
+    longMessage = False     # Smoke tests: default failure messages are enough
+
     schema = {  # JADN schema for selector tests
         'types': [
             ['T-attr-arr-tag', 'Array', [], '', [
@@ -881,9 +623,11 @@ class Selectors(unittest.TestCase):         # TODO: bad schema - verify * field
             ]]
         ]}
 
+    codec_min = _LazyCodec()        # Codecs for the encoding modes used by the tests, built when first used
+    codec_verbose = _LazyCodec(verbose_rec=True, verbose_str=True)
+
     def setUp(self):
-        jadn.check(self.schema)
-        self.tc = jadn.codec.Codec(self.schema)
+        self.tc = self.codec_min
 
     arr_name1_api = ['count', 17]
     arr_name2_api = ['color', 'green']
@@ -917,82 +661,6 @@ class Selectors(unittest.TestCase):         # TODO: bad schema - verify * field
     arr_tag4_bad_min = arr_name4_bad_min
     arr_tag5_bad_min = arr_name5_bad_min
 
-    def test_attr_arr_name_verbose(self):
-        self.tc.set_mode(verbose_rec=True, verbose_str=True)
-        self.assertListEqual(self.tc.encode('T-attr-arr-name', self.arr_name1_api), self.arr_name1_api)
-        self.assertListEqual(self.tc.decode('T-attr-arr-name', self.arr_name1_api), self.arr_name1_api)
-        self.assertListEqual(self.tc.encode('T-attr-arr-name', self.arr_name2_api), self.arr_name2_api)
-        self.assertListEqual(self.tc.decode('T-attr-arr-name', self.arr_name2_api), self.arr_name2_api)
-        self.assertListEqual(self.tc.encode('T-attr-arr-name', self.arr_name3_api), self.arr_name3_api)
-        self.assertListEqual(self.tc.decode('T-attr-arr-name', self.arr_name3_api), self.arr_name3_api)
-        self.assertListEqual(self.tc.encode('T-attr-arr-name', self.arr_name_a1_api), self.arr_name_a1_api)
-        self.assertListEqual(self.tc.decode('T-attr-arr-name', self.arr_name_a1_api), self.arr_name_a1_api)
-        self.assertListEqual(self.tc.encode('T-attr-arr-name', self.arr_names_a1_api), self.arr_names_a1_api)
-        self.assertListEqual(self.tc.decode('T-attr-arr-name', self.arr_names_a1_api), self.arr_names_a1_api)
-        self.assertListEqual(self.tc.encode('T-attr-arr-name', self.arr_name_p1_api), self.arr_name_p1_api)
-        self.assertListEqual(self.tc.decode('T-attr-arr-name', self.arr_name_p1_api), self.arr_name_p1_api)
-        self.assertListEqual(self.tc.encode('T-attr-arr-name', self.arr_names_p1_api), self.arr_names_p1_api)
-        self.assertListEqual(self.tc.decode('T-attr-arr-name', self.arr_names_p1_api), self.arr_names_p1_api)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-attr-arr-name', self.arr_name4_bad_api)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-attr-arr-name', self.arr_name4_bad_api)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-attr-arr-name', self.arr_name5_bad_api)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-attr-arr-name', self.arr_name5_bad_api)
-
-    def test_attr_arr_tag_verbose(self):
-        self.tc.set_mode(verbose_rec=True, verbose_str=True)
-        self.assertListEqual(self.tc.encode('T-attr-arr-tag', self.arr_tag1_api), self.arr_tag1_api)
-        self.assertListEqual(self.tc.decode('T-attr-arr-tag', self.arr_tag1_api), self.arr_tag1_api)
-        self.assertListEqual(self.tc.encode('T-attr-arr-tag', self.arr_tag2_api), self.arr_tag2_api)
-        self.assertListEqual(self.tc.decode('T-attr-arr-tag', self.arr_tag2_api), self.arr_tag2_api)
-        self.assertListEqual(self.tc.encode('T-attr-arr-tag', self.arr_tag3_api), self.arr_tag3_api)
-        self.assertListEqual(self.tc.decode('T-attr-arr-tag', self.arr_tag3_api), self.arr_tag3_api)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-attr-arr-tag', self.arr_tag4_bad_api)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-attr-arr-tag', self.arr_tag4_bad_api)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-attr-arr-tag', self.arr_tag5_bad_api)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-attr-arr-tag', self.arr_tag5_bad_api)
-
-    def test_attr_arr_name_min(self):
-        self.tc.set_mode(verbose_rec=False, verbose_str=False)
-        self.assertListEqual(self.tc.encode('T-attr-arr-name', self.arr_name1_api), self.arr_name1_min)
-        self.assertListEqual(self.tc.decode('T-attr-arr-name', self.arr_name1_min), self.arr_name1_api)
-        self.assertListEqual(self.tc.encode('T-attr-arr-name', self.arr_name2_api), self.arr_name2_min)
-        self.assertListEqual(self.tc.decode('T-attr-arr-name', self.arr_name2_min), self.arr_name2_api)
-        self.assertListEqual(self.tc.encode('T-attr-arr-name', self.arr_name3_api), self.arr_name3_min)
-        self.assertListEqual(self.tc.decode('T-attr-arr-name', self.arr_name3_min), self.arr_name3_api)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-attr-arr-name', self.arr_name4_bad_api)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-attr-arr-name', self.arr_name4_bad_min)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-attr-arr-name', self.arr_name5_bad_api)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-attr-arr-name', self.arr_name5_bad_min)
-
-    def test_attr_arr_tag_min(self):
-        self.tc.set_mode(verbose_rec=False, verbose_str=False)
-        self.assertListEqual(self.tc.encode('T-attr-arr-tag', self.arr_tag1_api), self.arr_tag1_min)
-        self.assertListEqual(self.tc.decode('T-attr-arr-tag', self.arr_tag1_min), self.arr_tag1_api)
-        self.assertListEqual(self.tc.encode('T-attr-arr-tag', self.arr_tag2_api), self.arr_tag2_min)
-        self.assertListEqual(self.tc.decode('T-attr-arr-tag', self.arr_tag2_min), self.arr_tag2_api)
-        self.assertListEqual(self.tc.encode('T-attr-arr-tag', self.arr_tag3_api), self.arr_tag3_min)
-        self.assertListEqual(self.tc.decode('T-attr-arr-tag', self.arr_tag3_min), self.arr_tag3_api)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-attr-arr-tag', self.arr_tag4_bad_api)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-attr-arr-tag', self.arr_tag4_bad_min)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-attr-arr-tag', self.arr_tag5_bad_api)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-attr-arr-tag', self.arr_tag5_bad_min)
-
     rec_name1_api = {'type': 'count', 'value': 17}
     rec_name2_api = {'type': 'color', 'value': 'green'}
     rec_name3_api = {'type': 'animal', 'value': {'cat': 'Fluffy'}}
@@ -1013,72 +681,48 @@ class Selectors(unittest.TestCase):         # TODO: bad schema - verify * field
     rec_name5_bad_min = ['Category', {'2': {'9': 10}}]
     """
 
-    def test_attr_rec_name_verbose(self):
-        self.tc.set_mode(verbose_rec=True, verbose_str=True)
-        self.assertDictEqual(self.tc.encode('T-attr-rec-name', self.rec_name1_api), self.rec_name1_api)
-        self.assertDictEqual(self.tc.decode('T-attr-rec-name', self.rec_name1_api), self.rec_name1_api)
-        self.assertDictEqual(self.tc.encode('T-attr-rec-name', self.rec_name2_api), self.rec_name2_api)
-        self.assertDictEqual(self.tc.decode('T-attr-rec-name', self.rec_name2_api), self.rec_name2_api)
-        self.assertDictEqual(self.tc.encode('T-attr-rec-name', self.rec_name3_api), self.rec_name3_api)
-        self.assertDictEqual(self.tc.decode('T-attr-rec-name', self.rec_name3_api), self.rec_name3_api)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-attr-rec-name', self.rec_name4_bad_api)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-attr-rec-name', self.rec_name4_bad_api)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-attr-rec-name', self.rec_name5_bad_api)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-attr-rec-name', self.rec_name5_bad_api)
-
-    def test_attr_rec_name_min(self):
-        self.tc.set_mode(verbose_rec=False, verbose_str=False)
-        self.assertListEqual(self.tc.encode('T-attr-rec-name', self.rec_name1_api), self.rec_name1_min)
-        self.assertDictEqual(self.tc.decode('T-attr-rec-name', self.rec_name1_min), self.rec_name1_api)
-        self.assertListEqual(self.tc.encode('T-attr-rec-name', self.rec_name2_api), self.rec_name2_min)
-        self.assertDictEqual(self.tc.decode('T-attr-rec-name', self.rec_name2_min), self.rec_name2_api)
-        self.assertListEqual(self.tc.encode('T-attr-rec-name', self.rec_name3_api), self.rec_name3_min)
-        self.assertDictEqual(self.tc.decode('T-attr-rec-name', self.rec_name3_min), self.rec_name3_api)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-attr-rec-name', self.rec_name4_bad_api)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-attr-rec-name', self.rec_name4_bad_min)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-attr-rec-name', self.rec_name5_bad_api)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-attr-rec-name', self.rec_name5_bad_min)
-
     pep_api = {'foo': 'bar', 'data': {'count': 17}}
     pec_api = {'foo': 'bar', 'data': {'animal': {'rat': {'length': 21, 'weight': .342}}}}
     pep_bad_api = {'foo': 'bar', 'data': {'turnip': ''}}
 
-    def test_property_explicit_verbose(self):
-        self.tc.set_mode(verbose_rec=True, verbose_str=True)
-        self.assertDictEqual(self.tc.encode('T-property-explicit-primitive', self.pep_api), self.pep_api)
-        self.assertDictEqual(self.tc.decode('T-property-explicit-primitive', self.pep_api), self.pep_api)
-        self.assertDictEqual(self.tc.encode('T-property-explicit-category', self.pec_api), self.pec_api)
-        self.assertDictEqual(self.tc.decode('T-property-explicit-category', self.pec_api), self.pec_api)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-property-explicit-primitive', self.pep_bad_api)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-property-explicit-primitive', self.pep_bad_api)
-
     pep_min = ['bar', {7: 17}]
     pec_min = ['bar', {2: {5: [21, 0.342]}}]
     pep_bad_min = ['bar', {'6': 17}]
 
-    def test_property_explicit_min(self):
-        self.tc.set_mode(verbose_rec=False, verbose_str=False)
-        self.assertListEqual(self.tc.encode('T-property-explicit-primitive', self.pep_api), self.pep_min)
-        self.assertDictEqual(self.tc.decode('T-property-explicit-primitive', self.pep_min), self.pep_api)
-        self.assertListEqual(self.tc.encode('T-property-explicit-category', self.pec_api), self.pec_min)
-        self.assertDictEqual(self.tc.decode('T-property-explicit-category', self.pec_min), self.pec_api)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-property-explicit-primitive', self.pep_bad_api)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-property-explicit-primitive', self.pep_bad_min)
+    CASES = (
+        ('attr_arr_name_verbose', 'codec_verbose', 'T-attr-arr-name',
+         [(a, a) for a in (arr_name1_api, arr_name2_api, arr_name3_api, arr_name_a1_api, arr_names_a1_api,
+                           arr_name_p1_api, arr_names_p1_api)],
+         (arr_name4_bad_api, arr_name5_bad_api), (arr_name4_bad_api, arr_name5_bad_api)),
+        ('attr_arr_tag_verbose', 'codec_verbose', 'T-attr-arr-tag',
+         [(a, a) for a in (arr_tag1_api, arr_tag2_api, arr_tag3_api)],
+         (arr_tag4_bad_api, arr_tag5_bad_api), (arr_tag4_bad_api, arr_tag5_bad_api)),
+        ('attr_arr_name_min', 'codec_min', 'T-attr-arr-name',
+         ((arr_name1_api, arr_name1_min), (arr_name2_api, arr_name2_min), (arr_name3_api, arr_name3_min)),
+         (arr_name4_bad_api, arr_name5_bad_api), (arr_name4_bad_min, arr_name5_bad_min)),
+        ('attr_arr_tag_min', 'codec_min', 'T-attr-arr-tag',
+         ((arr_tag1_api, arr_tag1_min), (arr_tag2_api, arr_tag2_min), (arr_tag3_api, arr_tag3_min)),
+         (arr_tag4_bad_api, arr_tag5_bad_api), (arr_tag4_bad_min, arr_tag5_bad_min)),
+        ('attr_rec_name_verbose', 'codec_verbose', 'T-attr-rec-name',
+         [(a, a) for a in (rec_name1_api, rec_name2_api, rec_name3_api)],
+         (rec_name4_bad_api, rec_name5_bad_api), (rec_name4_bad_api, rec_name5_bad_api)),
+        ('attr_rec_name_min', 'codec_min', 'T-attr-rec-name',
+         ((rec_name1_api, rec_name1_min), (rec_name2_api, rec_name2_min), (rec_name3_api, rec_name3_min)),
+         (rec_name4_bad_api, rec_name5_bad_api), (rec_name4_bad_min, rec_name5_bad_min)),
+        ('property_explicit_primitive_verbose', 'codec_verbose', 'T-property-explicit-primitive',
+         ((pep_api, pep_api),), (pep_bad_api,), (pep_bad_api,)),
+        ('property_explicit_category_verbose', 'codec_verbose', 'T-property-explicit-category',
+         ((pec_api, pec_api),), (), ()),
+        ('property_explicit_primitive_min', 'codec_min', 'T-property-explicit-primitive',
+         ((pep_api, pep_min),), (pep_bad_api,), (pep_bad_min,)),
+        ('property_explicit_category_min', 'codec_min', 'T-property-explicit-category',
+         ((pec_api, pec_min),), (), ()),
+    )
 
 
 class ListCardinality(unittest.TestCase):      # TODO: arrayOf(rec,map,array,arrayof,choice), array(), map(), rec()
+    longMessage = False     # Smoke tests: default failure messages are enough
+
     schema = {  # JADN schema for fields with cardinality > 1 (e.g., list of x)
         'types': [
             ['T-array0', 'ArrayOf', ['*String', '}2'], ''],         # Min array length = 0 (default), Max = 2
@@ -1109,9 +753,10 @@ class ListCardinality(unittest.TestCase):      # TODO: arrayOf(rec,map,array,arr
             ]]
         ]}
 
-    def setUp(self):
-        jadn.check(self.schema)
-        self.tc = jadn.codec.Codec(self.schema)
+    @classmethod
+    def setUpClass(cls):    # Check schema and build codec once, tests do not change its mode
+        _check_once(cls.schema)
+        cls.tc = jadn.codec.Codec(cls.schema, verbose_rec=True, verbose_str=True)
 
     Lna = {'string': 'cat'}                     # Cardinality 0..n field omits empty list.  Use ArrayOf type to send empty list.
     Lsa = {'string': 'cat', 'list': 'red'}      # Always invalid, value is a string, not a list of one string.
@@ -1120,143 +765,53 @@ class ListCardinality(unittest.TestCase):      # TODO: arrayOf(rec,map,array,arr
     L2a = {'string': 'cat', 'list': ['red', 'green']}
     L3a = {'string': 'cat', 'list': ['red', 'green', 'blue']}
 
-    def test_opt_list0_verbose(self):        # n-P, s-F, 0-P, 1-P, 2-P, 3-F
-        self.tc.set_mode(verbose_rec=True, verbose_str=True)
-        self.assertDictEqual(self.tc.encode('T-opt-list0', self.Lna), self.Lna)
-        self.assertDictEqual(self.tc.decode('T-opt-list0', self.Lna), self.Lna)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-opt-list0', self.Lsa)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-opt-list0', self.Lsa)
-        self.assertDictEqual(self.tc.encode('T-opt-list0', self.L0a), self.L0a)
-        self.assertDictEqual(self.tc.decode('T-opt-list0', self.L0a), self.L0a)
-        self.assertDictEqual(self.tc.encode('T-opt-list0', self.L1a), self.L1a)
-        self.assertDictEqual(self.tc.decode('T-opt-list0', self.L1a), self.L1a)
-        self.assertDictEqual(self.tc.encode('T-opt-list0', self.L2a), self.L2a)
-        self.assertDictEqual(self.tc.decode('T-opt-list0', self.L2a), self.L2a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-opt-list0', self.L3a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-opt-list0', self.L3a)
-
-    def test_opt_list1_verbose(self):        # n-P, s-F, 0-F, 1-P, 2-P, 3-F
-        self.tc.set_mode(verbose_rec=True, verbose_str=True)
-        self.assertDictEqual(self.tc.encode('T-opt-list1', self.Lna), self.Lna)
-        self.assertDictEqual(self.tc.decode('T-opt-list1', self.Lna), self.Lna)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-opt-list1', self.Lsa)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-opt-list1', self.Lsa)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-opt-list1', self.L0a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-opt-list1', self.L0a)
-        self.assertDictEqual(self.tc.encode('T-opt-list1', self.L1a), self.L1a)
-        self.assertDictEqual(self.tc.decode('T-opt-list1', self.L1a), self.L1a)
-        self.assertDictEqual(self.tc.encode('T-opt-list1', self.L2a), self.L2a)
-        self.assertDictEqual(self.tc.decode('T-opt-list1', self.L2a), self.L2a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-opt-list1', self.L3a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-opt-list1', self.L3a)
-
-    def test_list_1_2_verbose(self):        # n-F, s-F, 0-F, 1-P, 2-P, 3-F
-        self.tc.set_mode(verbose_rec=True, verbose_str=True)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-list-1-2', self.Lna)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-list-1-2', self.Lna)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-list-1-2', self.Lsa)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-list-1-2', self.Lsa)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-list-1-2', self.L0a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-list-1-2', self.L0a)
-        self.assertDictEqual(self.tc.encode('T-list-1-2', self.L1a), self.L1a)
-        self.assertDictEqual(self.tc.decode('T-list-1-2', self.L1a), self.L1a)
-        self.assertDictEqual(self.tc.encode('T-list-1-2', self.L2a), self.L2a)
-        self.assertDictEqual(self.tc.decode('T-list-1-2', self.L2a), self.L2a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-list-1-2', self.L3a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-list-1-2', self.L3a)
-
-    def test_list_0_2_verbose(self):        # n-P, s-F, 0-F, 1-P, 2-P, 3-F
-        self.tc.set_mode(verbose_rec=True, verbose_str=True)
-        self.assertDictEqual(self.tc.encode('T-list-0-2', self.Lna), self.Lna)
-        self.assertDictEqual(self.tc.decode('T-list-0-2', self.Lna), self.Lna)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-list-0-2', self.Lsa)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-list-0-2', self.Lsa)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-list-0-2', self.L0a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-list-0-2', self.L0a)
-        self.assertDictEqual(self.tc.encode('T-list-0-2', self.L1a), self.L1a)
-        self.assertDictEqual(self.tc.decode('T-list-0-2', self.L1a), self.L1a)
-        self.assertDictEqual(self.tc.encode('T-list-0-2', self.L2a), self.L2a)
-        self.assertDictEqual(self.tc.decode('T-list-0-2', self.L2a), self.L2a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-list-0-2', self.L3a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-list-0-2', self.L3a)
-
-    def test_list_2_3_verbose(self):        # n-F, 0-F, 1-F, 2-P, 3-P
-        self.tc.set_mode(verbose_rec=True, verbose_str=True)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-list-2-3', self.Lna)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-list-2-3', self.Lna)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-list-2-3', self.L0a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-list-2-3', self.L0a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-list-2-3', self.L1a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-list-2-3', self.L1a)
-        self.assertDictEqual(self.tc.encode('T-list-2-3', self.L2a), self.L2a)
-        self.assertDictEqual(self.tc.decode('T-list-2-3', self.L2a), self.L2a)
-        self.assertDictEqual(self.tc.encode('T-list-2-3', self.L3a), self.L3a)
-        self.assertDictEqual(self.tc.decode('T-list-2-3', self.L3a), self.L3a)
-
-    def test_list_1_n_verbose(self):        # n-F, 0-F, 1-P, 2-P, 3-P
-        self.tc.set_mode(verbose_rec=True, verbose_str=True)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-list-1-n', self.Lna)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-list-1-n', self.Lna)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-list-1-n', self.L0a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-list-1-n', self.L0a)
-        self.assertDictEqual(self.tc.encode('T-list-1-n', self.L1a), self.L1a)
-        self.assertDictEqual(self.tc.decode('T-list-1-n', self.L1a), self.L1a)
-        self.assertDictEqual(self.tc.encode('T-list-1-n', self.L2a), self.L2a)
-        self.assertDictEqual(self.tc.decode('T-list-1-n', self.L2a), self.L2a)
-        self.assertDictEqual(self.tc.encode('T-list-1-n', self.L3a), self.L3a)
-        self.assertDictEqual(self.tc.decode('T-list-1-n', self.L3a), self.L3a)
+    # All fixtures, and the fixtures that round-trip for each list type; the others fail in both directions
+    LIST_CASES = ('Lna', 'Lsa', 'L0a', 'L1a', 'L2a', 'L3a')
+    LIST_VALID = {
+        'T-opt-list0':  ('Lna', 'L0a', 'L1a', 'L2a'),
+        'T-opt-list1':  ('Lna', 'L1a', 'L2a'),
+        'T-list-1-2':   ('L1a', 'L2a'),
+        'T-list-0-2':   ('Lna', 'L1a', 'L2a'),
+        'T-list-2-3':   ('L2a', 'L3a'),
+        'T-list-1-n':   ('L1a', 'L2a', 'L3a'),
+    }
+
+    def _check_matrix(self, types):
+        for t in types:
+            enc, dec, valid = self.tc.encoder(t), self.tc.decoder(t), self.LIST_VALID[t]
+            for name in self.LIST_CASES:
+                v = getattr(self, name)
+                with self.subTest(t=t, case=name):
+                    if name in valid:
+                        _idem(self, self.tc, t, v)
+                    else:
+                        _must_raise_both(self, enc, dec, v)
+
+    def test_opt_lists_verbose(self):
+        self._check_matrix(('T-opt-list0', 'T-opt-list1'))
+
+    def test_lists_verbose(self):
+        self._check_matrix(('T-list-1-2', 'T-list-0-2', 'T-list-2-3', 'T-list-1-n'))
 
 
 class ListTypes(unittest.TestCase):
+    OPT_0_2 = ('[0', ']2')      # Field options shared by all list fields: min 0, max 2
+
     schema = {
         'types': [
             ['T-list', 'ArrayOf', ['*T-list-types'], ''],
             ['T-list-types', 'Record', [], '', [
-                [1, 'bins', 'Binary', ['[0', ']2'], ''],
-                [2, 'bools', 'Boolean', ['[0', ']2'], ''],
-                [3, 'ints', 'Integer', ['[0', ']2'], ''],
-                [4, 'strs', 'String', ['[0', ']2'], ''],
-                [5, 'arrs', 'T-arr', ['[0', ']2'], ''],
-                [6, 'aro_s', 'T-aro-s', ['[0', ']2'], ''],
-                [7, 'aro_ch', 'T-aro-ch', ['[0', ']2'], ''],
-                [8, 'choices', 'T-ch', ['[0', ']2'], ''],
-                [9, 'enums', 'T-enum', ['[0', ']2'], ''],
-                [10, 'maps', 'T-map', ['[0', ']2'], ''],
-                [11, 'recs', 'T-rec', ['[0', ']2'], '']
+                [1, 'bins', 'Binary', list(OPT_0_2), ''],
+                [2, 'bools', 'Boolean', list(OPT_0_2), ''],
+                [3, 'ints', 'Integer', list(OPT_0_2), ''],
+                [4, 'strs', 'String', list(OPT_0_2), ''],
+                [5, 'arrs', 'T-arr', list(OPT_0_2), ''],
+                [6, 'aro_s', 'T-aro-s', list(OPT_0_2), ''],
+                [7, 'aro_ch', 'T-aro-ch', list(OPT_0_2), ''],
+                [8, 'choices', 'T-ch', list(OPT_0_2), ''],
+                [9, 'enums', 'T-enum', list(OPT_0_2), ''],
+                [10, 'maps', 'T-map', list(OPT_0_2), ''],
+                [11, 'recs', 'T-rec', list(OPT_0_2), '']
             ]],
             ['T-arr', 'Array', [], '', [
                 [1, 'x', 'Integer', [], ''],
@@ -1282,9 +837,10 @@ class ListTypes(unittest.TestCase):
             ]]
         ]}
 
-    def setUp(self):
-        jadn.check(self.schema)
-        self.tc = jadn.codec.Codec(self.schema)
+    @classmethod
+    def setUpClass(cls):    # Check schema and build codec once, tests do not change its mode
+        _check_once(cls.schema)
+        cls.tc = jadn.codec.Codec(cls.schema, verbose_rec=True, verbose_str=True)
 
     prims = [{
             'bools': [True],
@@ -1302,35 +858,33 @@ class ListTypes(unittest.TestCase):
     ]
 
     def test_list_primitives(self):
-        self.tc.set_mode(verbose_rec=True, verbose_str=True)
-        self.assertListEqual(self.tc.encode('T-list', self.prims), self.prims)
-        self.assertListEqual(self.tc.decode('T-list', self.prims), self.prims)
-        self.assertListEqual(self.tc.encode('T-list', self.enums), self.enums)
-        self.assertListEqual(self.tc.decode('T-list', self.enums), self.enums)
+        _idem(self, self.tc, 'T-list', self.prims)
+        _idem(self, self.tc, 'T-list', self.enums)
 
 
 class Bounds(unittest.TestCase):        # TODO: check max and min string length, integer and number values, array sizes
                                         # TODO: Schema default and options
                                         # TODO: Array count for concise Records
-    schema = {
-        'types': [
+    SIZE_2_3 = ('{2', '}3')     # Type options shared by the compound types: 2..3 elements
+
+    schema = {        'types': [
             ['Int', 'Integer', [], ''],
             ['Num', 'Number', [], ''],
             ['Int-3-6', 'Integer', ['{3', '}6'], ''],
             ['Num-3-6', 'Number', ['y3.0', 'z6.0'], ''],
-            ['T-Map23', 'Map', ['{2', '}3'], '', [
+            ['T-Map23', 'Map', list(SIZE_2_3), '', [
                 [2, 'red', 'Integer', ['[0'], ''],
                 [4, 'green', 'Integer', ['[0'], ''],
                 [6, 'blue', 'Integer', ['[0'], ''],
                 [9, 'alpha', 'Integer', [], '']
             ]],
-            ['T-Arr23', 'Array', ['{2', '}3'], '', [
+            ['T-Arr23', 'Array', list(SIZE_2_3), '', [
                 [1, 'red', 'Integer', ['[0'], ''],
                 [2, 'green', 'Integer', ['[0'], ''],
                 [3, 'blue', 'Integer', ['[0'], ''],
                 [4, 'alpha', 'Integer', [], '']
             ]],
-            ['T-Rec23', 'Record', ['{2', '}3'], '', [
+            ['T-Rec23', 'Record', list(SIZE_2_3), '', [
                 [1, 'red', 'Integer', ['[0'], ''],
                 [2, 'green', 'Integer', ['[0'], ''],
                 [3, 'blue', 'Integer', ['[0'], ''],
@@ -1339,9 +893,10 @@ class Bounds(unittest.TestCase):        # TODO: check max and min string length,
         ]
     }
 
-    def setUp(self):
-        jadn.check(self.schema)
-        self.tc = jadn.codec.Codec(self.schema, verbose_rec=True, verbose_str=True)
+    @classmethod
+    def setUpClass(cls):    # Check schema and build codec once, tests do not change its mode
+        _check_once(cls.schema)
+        cls.tc = jadn.codec.Codec(cls.schema, verbose_rec=True, verbose_str=True)
 
     i1 = 1
     i5 = 5
@@ -1351,34 +906,20 @@ class Bounds(unittest.TestCase):        # TODO: check max and min string length,
     f9 = 9.8
 
     def test_int(self):
-        self.tc.set_mode(verbose_rec=True, verbose_str=True)
-        self.assertEqual(self.tc.encode('Int', self.i1), self.i1)
-        self.assertEqual(self.tc.decode('Int', self.i1), self.i1)
-        self.assertEqual(self.tc.encode('Int', self.i5), self.i5)
-        self.assertEqual(self.tc.decode('Int', self.i5), self.i5)
-        self.assertEqual(self.tc.encode('Int', self.i9), self.i9)
-        self.assertEqual(self.tc.decode('Int', self.i9), self.i9)
-        self.assertEqual(self.tc.encode('Int-3-6', self.i5), self.i5)
-        self.assertEqual(self.tc.decode('Int-3-6', self.i5), self.i5)
-        with self.assertRaises(ValueError):
-            self.tc.encode('Int-3-6', self.i1)
-        with self.assertRaises(ValueError):
-            self.tc.encode('Int-3-6', self.i9)
+        _idem(self, self.tc, 'Int', self.i1)
+        _idem(self, self.tc, 'Int', self.i5)
+        _idem(self, self.tc, 'Int', self.i9)
+        _idem(self, self.tc, 'Int-3-6', self.i5)
+        _must_raise(self, self.tc.encode, 'Int-3-6', self.i1)
+        _must_raise(self, self.tc.encode, 'Int-3-6', self.i9)
 
     def test_num(self):
-        self.tc.set_mode(verbose_rec=True, verbose_str=True)
-        self.assertEqual(self.tc.encode('Num', self.f1), self.f1)
-        self.assertEqual(self.tc.decode('Num', self.f1), self.f1)
-        self.assertEqual(self.tc.encode('Num', self.f5), self.f5)
-        self.assertEqual(self.tc.decode('Num', self.f5), self.f5)
-        self.assertEqual(self.tc.encode('Num', self.f9), self.f9)
-        self.assertEqual(self.tc.decode('Num', self.f9), self.f9)
-        self.assertEqual(self.tc.encode('Num-3-6', self.f5), self.f5)
-        self.assertEqual(self.tc.decode('Num-3-6', self.f5), self.f5)
-        with self.assertRaises(ValueError):
-            self.tc.encode('Num-3-6', self.f1)
-        with self.assertRaises(ValueError):
-            self.tc.encode('Num-3-6', self.f9)
+        _idem(self, self.tc, 'Num', self.f1)
+        _idem(self, self.tc, 'Num', self.f5)
+        _idem(self, self.tc, 'Num', self.f9)
+        _idem(self, self.tc, 'Num-3-6', self.f5)
+        _must_raise(self, self.tc.encode, 'Num-3-6', self.f1)
+        _must_raise(self, self.tc.encode, 'Num-3-6', self.f9)
 
     a0 = []
     a1 = [30]
@@ -1394,74 +935,22 @@ class Bounds(unittest.TestCase):        # TODO: check max and min string length,
     d3a = {'green': 5, 'blue': 8, 'alpha': 15}
     d4a = {'red': 9, 'green': 12, 'blue': 14, 'alpha': 20}
 
-    def test_array23(self):
-        self.tc.set_mode(verbose_rec=True, verbose_str=True)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-Arr23', self.a0)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-Arr23', self.a0)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-Arr23', self.a1)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-Arr23', self.a1)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-Arr23', self.a1a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-Arr23', self.a1a)
-        self.assertEqual(self.tc.encode('T-Arr23', self.a2a), self.a2a)
-        self.assertEqual(self.tc.decode('T-Arr23', self.a2a), self.a2a)
-        self.assertEqual(self.tc.encode('T-Arr23', self.a3a), self.a3a)
-        self.assertEqual(self.tc.decode('T-Arr23', self.a3a), self.a3a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-Arr23', self.a4a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-Arr23', self.a4a)
-
-    def test_map23(self):
-        self.tc.set_mode(verbose_rec=True, verbose_str=True)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-Map23', self.d0)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-Map23', self.d0)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-Map23', self.d1)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-Map23', self.d1)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-Map23', self.d1a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-Map23', self.d1a)
-        self.assertEqual(self.tc.encode('T-Map23', self.d2a), self.d2a)
-        self.assertEqual(self.tc.decode('T-Map23', self.d2a), self.d2a)
-        self.assertEqual(self.tc.encode('T-Map23', self.d3a), self.d3a)
-        self.assertEqual(self.tc.decode('T-Map23', self.d3a), self.d3a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-Map23', self.d4a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-Map23', self.d4a)
-
-    def test_rec23(self):
-        self.tc.set_mode(verbose_rec=True, verbose_str=True)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-Rec23', self.d0)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-Rec23', self.d0)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-Rec23', self.d1)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-Rec23', self.d1)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-Rec23', self.d1a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-Rec23', self.d1a)
-        self.assertEqual(self.tc.encode('T-Rec23', self.d2a), self.d2a)
-        self.assertEqual(self.tc.decode('T-Rec23', self.d2a), self.d2a)
-        self.assertEqual(self.tc.encode('T-Rec23', self.d3a), self.d3a)
-        self.assertEqual(self.tc.decode('T-Rec23', self.d3a), self.d3a)
-        with self.assertRaises(ValueError):
-            self.tc.encode('T-Rec23', self.d4a)
-        with self.assertRaises(ValueError):
-            self.tc.decode('T-Rec23', self.d4a)
+    # Fixtures for each 2..3 element type, and the fixtures that round-trip; the others fail in both directions
+    SIZE23_CASES = (
+        ('T-Arr23', ('a0', 'a1', 'a1a', 'a2a', 'a3a', 'a4a'), ('a2a', 'a3a')),
+        ('T-Map23', ('d0', 'd1', 'd1a', 'd2a', 'd3a', 'd4a'), ('d2a', 'd3a')),
+        ('T-Rec23', ('d0', 'd1', 'd1a', 'd2a', 'd3a', 'd4a'), ('d2a', 'd3a')),
+    )
+
+    def test_size23(self):
+        for t, names, valid in self.SIZE23_CASES:
+            for name in names:
+                v = getattr(self, name)
+                with self.subTest(t=t, case=name):
+                    if name in valid:
+                        _idem(self, self.tc, t, v)
+                    else:
+                        _must_raise_both(self, self.tc.encode, self.tc.decode, t, v)
 
 
 class Format(unittest.TestCase):
@@ -1499,53 +988,51 @@ class Format(unittest.TestCase):
         ]
     }
 
-    def setUp(self):
-        jadn.check(self.schema)
-        self.tc = jadn.codec.Codec(self.schema)
+    @classmethod
+    def setUpClass(cls):    # Check schema and build codec once, tests do not change its mode
+        _check_once(cls.schema)
+        cls.tc = jadn.codec.Codec(cls.schema, verbose_rec=True, verbose_str=True)
 
-    ipv4_b = binascii.a2b_hex('c6020304')           # IPv4 address
+    def test_format_table_copy(self):   # Each codec has its own table of format validation functions
+        tc = jadn.codec.Codec(self.schema)
+        tc.format_validate['String']['email'] = str
+        self.assertIsNot(tc.format_validate, self.tc.format_validate)
+        self.assertIsNot(self.tc.format_validate['String']['email'], str)
+        self.assertIsNot(jadn.codec.format_validators()['String']['email'], str)
+
+    ipv4_b = bytes.fromhex('c6020304')              # IPv4 address
     ipv4_s64 = 'xgIDBA'                             # Base64url encoded
     ipv4_sx = 'C6020304'                            # Hex encoded
     ipv4_str = '198.2.3.4'                          # IPv4-string encoded
-    ipv4_b1_bad = binascii.a2b_hex('c60203')        # Too short
-    ipv4_b2_bad = binascii.a2b_hex('c602030456')    # Too long
+    ipv4_b1_bad = bytes.fromhex('c60203')           # Too short
+    ipv4_b2_bad = bytes.fromhex('c602030456')       # Too long
     ipv4_s64_bad = 'xgIDBFY'                        # Too long
     ipv4_sx_bad = 'C602030456'                      # Too long
     ipv4_str_bad = '198.2.3.4.56'                   # Too long
 
     def test_ipv4_addr(self):
-        self.tc.set_mode(verbose_rec=True, verbose_str=True)
         self.assertEqual(self.tc.encode('IPv4-Bin', self.ipv4_b), self.ipv4_s64)
         self.assertEqual(self.tc.decode('IPv4-Bin', self.ipv4_s64), self.ipv4_b)
         self.assertEqual(self.tc.encode('IPv4-Hex', self.ipv4_b), self.ipv4_sx)
         self.assertEqual(self.tc.decode('IPv4-Hex', self.ipv4_sx), self.ipv4_b)
         self.assertEqual(self.tc.encode('IPv4-String', self.ipv4_b), self.ipv4_str)
         self.assertEqual(self.tc.decode('IPv4-String', self.ipv4_str), self.ipv4_b)
-        with self.assertRaises(ValueError):
-            self.tc.encode('IPv4-Hex', self.ipv4_b1_bad)
-        with self.assertRaises(ValueError):
-            self.tc.encode('IPv4-Hex', self.ipv4_b1_bad)
-        with self.assertRaises(ValueError):
-            self.tc.decode('IPv4-Bin', self.ipv4_s64_bad)
-        with self.assertRaises(ValueError):
-            self.tc.decode('IPv4-Hex', self.ipv4_sx_bad)
-        with self.assertRaises(ValueError):
-            self.tc.decode('IPv4-String', self.ipv4_str_bad)
-        with self.assertRaises(ValueError):
-            self.tc.encode('IPv4-Bin', b'')
-        with self.assertRaises(ValueError):
-            self.tc.decode('IPv4-Bin', '')
-        with self.assertRaises(ValueError):
-            self.tc.encode('IPv4-Hex', b'')
-        with self.assertRaises(ValueError):
-            self.tc.decode('IPv4-Hex', '')
-        with self.assertRaises(ValueError):
-            self.tc.encode('IPv4-String', b'')
-        with self.assertRaises(ValueError):
-            self.tc.decode('IPv4-String', '')
+        _must_raise(self, self.tc.encode, 'IPv4-Hex', self.ipv4_b1_bad)
+        _must_raise(self, self.tc.encode, 'IPv4-Hex', self.ipv4_b1_bad)
+        _must_raise(self, self.tc.decode, 'IPv4-Bin', self.ipv4_s64_bad)
+        _must_raise(self, self.tc.decode, 'IPv4-Hex', self.ipv4_sx_bad)
+        _must_raise(self, self.tc.decode, 'IPv4-Hex', self.ipv4_sx.lower(), exc=TypeError)     # /X is upper case
+        _must_raise(self, self.tc.decode, 'IPv4-Hex', 'C6 02 03 04', exc=TypeError)
+        _must_raise(self, self.tc.decode, 'IPv4-String', self.ipv4_str_bad)
+        _must_raise(self, self.tc.encode, 'IPv4-Bin', b'')
+        _must_raise(self, self.tc.decode, 'IPv4-Bin', '')
+        _must_raise(self, self.tc.encode, 'IPv4-Hex', b'')
+        _must_raise(self, self.tc.decode, 'IPv4-Hex', '')
+        _must_raise(self, self.tc.encode, 'IPv4-String', b'')
+        _must_raise(self, self.tc.decode, 'IPv4-String', '')
 
     ipv4_net_str = '192.168.0.0/20'                     # IPv4 CIDR network address (not class C /24)
-    ipv4_net_a = [binascii.a2b_hex('c0a80000'), 20]
+    ipv4_net_a = [bytes.fromhex('c0a80000'), 20]
 
     def test_ipv4_net(self):
         self.assertEqual(self.tc.encode('IPv4-Net', self.ipv4_net_a), self.ipv4_net_str)
@@ -1553,13 +1040,17 @@ class Format(unittest.TestCase):
         # with self.assertRaises(ValueError):
         #    self.tc.encode('IPv4-Net', self.ipv4_net_bad1)
 
-    ipv6_b = binascii.a2b_hex('20010db885a3000000008a2e03707334')   # IPv6 address
+    ipv6_b = bytes.fromhex('20010db885a3000000008a2e03707334')      # IPv6 address
     ipv6_s64 = 'IAENuIWjAAAAAIouA3BzNA'                             # Base64 encoded
     ipv6_sx = '20010DB885A3000000008A2E03707334'                    # Hex encoded
     ipv6_str1 = '2001:db8:85a3::8a2e:370:7334'                      # IPv6-string encoded
     ipv6_str2 = '2001:db8:85a3::8a2e:0370:7334'                     # IPv6-string encoded - leading 0
     ipv6_str3 = '2001:db8:85A3::8a2e:370:7334'                      # IPv6-string encoded - uppercase
     ipv6_str4 = '2001:db8:85a3:0::8a2e:370:7334'                    # IPv6-string encoded - zero not compressed
+    ipv6_mapped_b = bytes.fromhex('00000000000000000000ffff01020304')   # IPv4-mapped address
+    ipv6_mapped_str = '::ffff:102:304'                               # Hex groups, not dotted quad, on every platform
+    ipv6_zone_str = 'fe80::1%eth0'                                   # Zone ID is not part of the 16-byte address
+    ipv6_zone_b = bytes.fromhex('fe800000000000000000000000000001')
 
     def test_ipv6_addr(self):
         self.assertEqual(self.tc.encode('IPv6-Base64url', self.ipv6_b), self.ipv6_s64)
@@ -1568,34 +1059,42 @@ class Format(unittest.TestCase):
         self.assertEqual(self.tc.decode('IPv6-Hex', self.ipv6_sx), self.ipv6_b)
         self.assertEqual(self.tc.encode('IPv6-String', self.ipv6_b), self.ipv6_str1)
         self.assertEqual(self.tc.decode('IPv6-String', self.ipv6_str1), self.ipv6_b)
+        self.assertEqual(self.tc.decode('IPv6-String', self.ipv6_str2), self.ipv6_b)
+        self.assertEqual(self.tc.decode('IPv6-String', self.ipv6_str3), self.ipv6_b)
+        self.assertEqual(self.tc.decode('IPv6-String', self.ipv6_str4), self.ipv6_b)
+        _must_raise(self, self.tc.decode, 'IPv6-String', self.ipv4_str)
+        self.assertEqual(self.tc.encode('IPv6-String', self.ipv6_mapped_b), self.ipv6_mapped_str)
+        self.assertEqual(self.tc.decode('IPv6-String', self.ipv6_mapped_str), self.ipv6_mapped_b)
+        self.assertEqual(self.tc.decode('IPv6-String', self.ipv6_zone_str), self.ipv6_zone_b)
 
     ipv6_net_str = '2001:db8:85a3::8a2e:370:7334/64'                # IPv6 network address
-    ipv6_net_a = [binascii.a2b_hex('20010db885a3000000008a2e03707334'), 64]
+    ipv6_net_a = [ipv6_b, 64]
 
     def test_ipv6_net(self):
         self.assertEqual(self.tc.encode('IPv6-Net', self.ipv6_net_a), self.ipv6_net_str)
         self.assertEqual(self.tc.decode('IPv6-Net', self.ipv6_net_str), self.ipv6_net_a)
 
-    eui48b = binascii.a2b_hex('002186b56e10')
-    eui48s = '002186b56e10'.upper()
-    eui64b = binascii.a2b_hex('022186fffeb56e10')
-    eui64s = '022186fffeb56e10'.upper()
-    eui48b_bad = binascii.a2b_hex('0226fffeb56e10')
-    eui48s_bad = '0226fffeb56e10'.upper()
+    eui48b = bytes.fromhex('002186b56e10')
+    eui48s = '002186B56E10'
+    eui64b = bytes.fromhex('022186fffeb56e10')
+    eui64s = '022186FFFEB56E10'
+    eui48b_bad = bytes.fromhex('0226fffeb56e10')
+    eui48s_bad = '0226FFFEB56E10'
 
     def test_mac_addr(self):
         self.assertEqual(self.tc.encode('MAC-Addr', self.eui48b), self.eui48s)
         self.assertEqual(self.tc.decode('MAC-Addr', self.eui48s), self.eui48b)
         self.assertEqual(self.tc.encode('MAC-Addr', self.eui64b), self.eui64s)
         self.assertEqual(self.tc.decode('MAC-Addr', self.eui64s), self.eui64b)
-        with self.assertRaises(ValueError):
-            self.tc.encode('MAC-Base64url', self.eui48b_bad)
-        with self.assertRaises(ValueError):
-            self.tc.decode('MAC-Base64url', self.eui48s_bad)
-
-    uuid_b = binascii.a2b_hex('c04d79b28d8b4a7683adfb4f3770cfbc')
-    uuid_b_bad1 = binascii.a2b_hex('c04d79b28d8b4a7683adfb4f3770cf')
-    uuid_b_bad2 = binascii.a2b_hex('c04d79b28d8b4a7683adfb4f3770cfbc6f')
+        _must_raise(self, self.tc.encode, 'MAC-Addr', self.eui48b_bad)
+        _must_raise(self, self.tc.decode, 'MAC-Addr', self.eui48s_bad, exc=TypeError)          # Bad length
+        _must_raise(self, self.tc.decode, 'MAC-Addr', '002186B56E1G', exc=TypeError)            # Not hex
+        _must_raise(self, self.tc.decode, 'MAC-Addr', '002186 56E10', exc=TypeError)            # Whitespace
+        _must_raise(self, self.tc.decode, 'MAC-Addr', self.eui48s.lower(), exc=TypeError)       # /eui is upper case
+
+    uuid_b = bytes.fromhex('c04d79b28d8b4a7683adfb4f3770cfbc')
+    uuid_b_bad1 = bytes.fromhex('c04d79b28d8b4a7683adfb4f3770cf')
+    uuid_b_bad2 = bytes.fromhex('c04d79b28d8b4a7683adfb4f3770cfbc6f')
     uuid_h = 'c04d79b2-8d8b-4a76-83ad-fb4f3770cfbc'
     uuid_hu = 'C04D79B2-8D8B-4A76-83AD-FB4F3770CFBC'
     uuid_h_bad1 = 'c04d79b28d8b4a7683adfb4f3770cfbc'
@@ -1608,20 +1107,13 @@ class Format(unittest.TestCase):
         self.assertEqual(self.tc.encode('UUID', self.uuid_b), self.uuid_h)
         self.assertEqual(self.tc.decode('UUID', self.uuid_h), self.uuid_b)
         self.assertEqual(self.tc.decode('UUID', self.uuid_hu), self.uuid_b)
-        with self.assertRaises(ValueError):
-            self.tc.encode('UUID', self.uuid_b_bad1)
-        with self.assertRaises(ValueError):
-            self.tc.encode('UUID', self.uuid_b_bad2)
-        with self.assertRaises(ValueError):
-            self.tc.decode('UUID', self.uuid_h_bad1)
-        with self.assertRaises(ValueError):
-            self.tc.decode('UUID', self.uuid_h_bad2)
-        with self.assertRaises(ValueError):
-            self.tc.decode('UUID', self.uuid_h_bad3)
-        with self.assertRaises(ValueError):
-            self.tc.decode('UUID', self.uuid_h_bad4)
-        with self.assertRaises(ValueError):
-            self.tc.decode('UUID', self.uuid_h_bad5)
+        _must_raise(self, self.tc.encode, 'UUID', self.uuid_b_bad1)
+        _must_raise(self, self.tc.encode, 'UUID', self.uuid_b_bad2)
+        _must_raise(self, self.tc.decode, 'UUID', self.uuid_h_bad1)
+        _must_raise(self, self.tc.decode, 'UUID', self.uuid_h_bad2)
+        _must_raise(self, self.tc.decode, 'UUID', self.uuid_h_bad3)
+        _must_raise(self, self.tc.decode, 'UUID', self.uuid_h_bad4)
+        _must_raise(self, self.tc.decode, 'UUID', self.uuid_h_bad5)
 
     tag_uuid_b = ['action', uuid_b]
     tag_uuid_h = 'action-c04d79b2-8d8b-4a76-83ad-fb4f3770cfbc'
@@ -1638,18 +1130,12 @@ class Format(unittest.TestCase):
     def test_email(self):
         self.assertEqual(self.tc.encode('Email-Addr', self.email1s), self.email1s)
         self.assertEqual(self.tc.decode('Email-Addr', self.email1s), self.email1s)
-        with self.assertRaises(ValueError):
-            self.tc.encode('Email-Addr', self.email2s_bad)
-        with self.assertRaises(ValueError):
-            self.tc.decode('Email-Addr', self.email2s_bad)
-        with self.assertRaises(ValueError):
-            self.tc.encode('Email-Addr', self.email3s_bad)
-        with self.assertRaises(ValueError):
-            self.tc.decode('Email-Addr', self.email3s_bad)
-        with self.assertRaises(ValueError):
-            self.tc.encode('Email-Addr', self.email4s_bad)
-        with self.assertRaises(ValueError):
-            self.tc.decode('Email-Addr', self.email4s_bad)
+        _must_raise(self, self.tc.encode, 'Email-Addr', self.email2s_bad)
+        _must_raise(self, self.tc.decode, 'Email-Addr', self.email2s_bad)
+        _must_raise(self, self.tc.encode, 'Email-Addr', self.email3s_bad)
+        _must_raise(self, self.tc.decode, 'Email-Addr', self.email3s_bad)
+        _must_raise(self, self.tc.encode, 'Email-Addr', self.email4s_bad)
+        _must_raise(self, self.tc.decode, 'Email-Addr', self.email4s_bad)
 
     hostname1s = 'eewww.example.com'
     hostname2s = 'top-gun.2600.xyz'                     # No TLD registry, no requirement to be FQDN
@@ -1664,20 +1150,14 @@ class Format(unittest.TestCase):
         self.assertEqual(self.tc.decode('Hostname', self.hostname2s), self.hostname2s)
         self.assertEqual(self.tc.encode('Hostname', self.hostname3s), self.hostname3s)
         self.assertEqual(self.tc.decode('Hostname', self.hostname3s), self.hostname3s)
-        with self.assertRaises(ValueError):
-            self.tc.encode('Hostname', self.hostname1s_bad)
-        with self.assertRaises(ValueError):
-            self.tc.decode('Hostname', self.hostname1s_bad)
-        with self.assertRaises(ValueError):
-            self.tc.encode('Hostname', self.hostname2s_bad)
-        with self.assertRaises(ValueError):
-            self.tc.decode('Hostname', self.hostname2s_bad)
-        with self.assertRaises(ValueError):
-            self.tc.encode('Hostname', self.email1s)
-        with self.assertRaises(ValueError):
-            self.tc.decode('Hostname', self.email1s)
-
-    good_urls = [       # Some examples from WHATWG spec (which uses URL as a synonym for URI, so URNs are valid URLs)
+        _must_raise(self, self.tc.encode, 'Hostname', self.hostname1s_bad)
+        _must_raise(self, self.tc.decode, 'Hostname', self.hostname1s_bad)
+        _must_raise(self, self.tc.encode, 'Hostname', self.hostname2s_bad)
+        _must_raise(self, self.tc.decode, 'Hostname', self.hostname2s_bad)
+        _must_raise(self, self.tc.encode, 'Hostname', self.email1s)
+        _must_raise(self, self.tc.decode, 'Hostname', self.email1s)
+
+    good_urls = (       # Some examples from WHATWG spec (which uses URL as a synonym for URI, so URNs are valid URLs)
         'http://example.com/resource?foo=bar#fragment',
         'urn:isbn:0451450523',
         'urn:uuid:6e8bc430-9c3a-11d9-9669-0800200c9a66',
@@ -1685,8 +1165,8 @@ class Format(unittest.TestCase):
         'file://loc%61lhost/',
         'https://EXAMPLE.com/../x',
         'https://example.org//',
-    ]
-    bad_urls = [
+    )
+    bad_urls = (
         'www.example.com/index.html',       # Missing scheme
         # 'https:example.org',                  # // is required
         # 'https://////example.com///',
@@ -1696,17 +1176,18 @@ class Format(unittest.TestCase):
         'https://example.org/foo bar',      # Extra whitespace
         'https://example.com:demo',         #
         'http://[www.example.com]/',        #
-    ]
+    )
 
     def test_uri(self):
+        enc, dec = self.tc.encoder('URI'), self.tc.decoder('URI')
         for uri in self.good_urls:
-            self.assertEqual(self.tc.encode('URI', uri), uri)
-            self.assertEqual(self.tc.decode('URI', uri), uri)
+            self.assertEqual(enc(uri), uri)
+            self.assertEqual(dec(uri), uri)
         for uri in self.bad_urls:
-            with self.assertRaises(ValueError):
-                self.tc.encode('URI', uri)
-            with self.assertRaises(ValueError):
-                self.tc.decode('URI', uri)
+            _must_raise(self, enc, uri)
+            _must_raise(self, dec, uri)
+        _must_raise(self, self.tc.encoder, 'URL')
+        _must_raise(self, self.tc.decoder, 'URL')
 
     dt1 = 1626634165000
     dt4 = 1626634165394
@@ -1724,87 +1205,23 @@ class Format(unittest.TestCase):
         self.assertEqual(self.tc.decode('DateTime', self.dts3), self.dt1)
         self.assertEqual(self.tc.decode('DateTime', self.dts4), self.dt4)
 
-    int8v0 = 0
-    int8v1 = -128
-    int8v2 =  127
-    int8v3 = -129
-    int8v4 =  128
-
-    int16v1 = -32768
-    int16v2 =  32767
-    int16v3 = -32769
-    int16v4 =  32768
-
-    int32v1 = -2147483648
-    int32v2 =  2147483647
-    int32v3 = -2147483649
-    int32v4 =  2147483648
-
-    int64v1 = -9223372036854775808
-    int64v2 =  9223372036854775807
-    int64v3 = -9223372036854775809
-    int64v4 =  9223372036854775808
+    # Sized integer types and their (min, max) values; min - 1 and max + 1 are out of range
+    SIZED_INTS = (
+        ('Int8', -128, 127),
+        ('Int16', -32768, 32767),
+        ('Int32', -2147483648, 2147483647),
+        ('Int64', -9223372036854775808, 9223372036854775807),
+    )
 
     def test_sized_ints(self):
-        self.assertEqual(self.tc.encode('Int8', self.int8v0), self.int8v0)
-        self.assertEqual(self.tc.decode('Int8', self.int8v0), self.int8v0)
-        self.assertEqual(self.tc.encode('Int8', self.int8v1), self.int8v1)
-        self.assertEqual(self.tc.decode('Int8', self.int8v1), self.int8v1)
-        self.assertEqual(self.tc.encode('Int8', self.int8v2), self.int8v2)
-        self.assertEqual(self.tc.decode('Int8', self.int8v2), self.int8v2)
-        with self.assertRaises(ValueError):
-            self.tc.encode('Int8', self.int8v3)
-        with self.assertRaises(ValueError):
-            self.tc.decode('Int8', self.int8v3)
-        with self.assertRaises(ValueError):
-            self.tc.encode('Int8', self.int8v4)
-        with self.assertRaises(ValueError):
-            self.tc.decode('Int8', self.int8v4)
-
-        self.assertEqual(self.tc.encode('Int16', self.int8v0), self.int8v0)
-        self.assertEqual(self.tc.decode('Int16', self.int8v0), self.int8v0)
-        self.assertEqual(self.tc.encode('Int16', self.int16v1), self.int16v1)
-        self.assertEqual(self.tc.decode('Int16', self.int16v1), self.int16v1)
-        self.assertEqual(self.tc.encode('Int16', self.int16v2), self.int16v2)
-        self.assertEqual(self.tc.decode('Int16', self.int16v2), self.int16v2)
-        with self.assertRaises(ValueError):
-            self.tc.encode('Int16', self.int16v3)
-        with self.assertRaises(ValueError):
-            self.tc.decode('Int16', self.int16v3)
-        with self.assertRaises(ValueError):
-            self.tc.encode('Int16', self.int16v4)
-        with self.assertRaises(ValueError):
-            self.tc.decode('Int16', self.int16v4)
-
-        self.assertEqual(self.tc.encode('Int32', self.int8v0), self.int8v0)
-        self.assertEqual(self.tc.decode('Int32', self.int8v0), self.int8v0)
-        self.assertEqual(self.tc.encode('Int32', self.int32v1), self.int32v1)
-        self.assertEqual(self.tc.decode('Int32', self.int32v1), self.int32v1)
-        self.assertEqual(self.tc.encode('Int32', self.int32v2), self.int32v2)
-        self.assertEqual(self.tc.decode('Int32', self.int32v2), self.int32v2)
-        with self.assertRaises(ValueError):
-            self.tc.encode('Int32', self.int32v3)
-        with self.assertRaises(ValueError):
-            self.tc.decode('Int32', self.int32v3)
-        with self.assertRaises(ValueError):
-            self.tc.encode('Int32', self.int32v4)
-        with self.assertRaises(ValueError):
-            self.tc.decode('Int32', self.int32v4)
-
-        self.assertEqual(self.tc.encode('Int64', self.int8v0), self.int8v0)
-        self.assertEqual(self.tc.decode('Int64', self.int8v0), self.int8v0)
-        self.assertEqual(self.tc.encode('Int64', self.int64v1), self.int64v1)
-        self.assertEqual(self.tc.decode('Int64', self.int64v1), self.int64v1)
-        self.assertEqual(self.tc.encode('Int64', self.int64v2), self.int64v2)
-        self.assertEqual(self.tc.decode('Int64', self.int64v2), self.int64v2)
-        with self.assertRaises(ValueError):
-            self.tc.encode('Int64', self.int64v3)
-        with self.assertRaises(ValueError):
-            self.tc.decode('Int64', self.int64v3)
-        with self.assertRaises(ValueError):
-            self.tc.encode('Int64', self.int64v4)
-        with self.assertRaises(ValueError):
-            self.tc.decode('Int64', self.int64v4)
+        for t, lo, hi in self.SIZED_INTS:
+            enc, dec = self.tc.encoder(t), self.tc.decoder(t)
+            for v in (0, lo, hi):
+                with self.subTest(t=t, v=v):
+                    _idem(self, self.tc, t, v)
+            for v in (lo - 1, hi + 1):
+                with self.subTest(t=t, v=v):
+                    _must_raise_both(self, enc, dec, v)
 
 
 class Union(unittest.TestCase):
@@ -1842,9 +1259,10 @@ class Union(unittest.TestCase):
         ]
     }
 
-    def setUp(self):
-        jadn.check(self.schema)
-        self.tc = jadn.codec.Codec(self.schema, verbose_rec=True, verbose_str=True)
+    @classmethod
+    def setUpClass(cls):    # Check schema and build codec once, tests do not change its mode
+        _check_once(cls.schema)
+        cls.tc = jadn.codec.Codec(cls.schema, verbose_rec=True, verbose_str=True)
 
     phone1 = 'home'
     phone2 = 'office'
@@ -1856,14 +1274,10 @@ class Union(unittest.TestCase):
         self.assertEqual(self.tc.decode('PhoneAny', self.phone2), self.phone2)
         self.assertEqual(self.tc.encode('PhoneAll', self.phone1), self.phone1)
         self.assertEqual(self.tc.decode('PhoneAll', self.phone1), self.phone1)
-        with self.assertRaises(ValueError):
-            self.tc.encode('PhoneAll', self.phone2)
-        with self.assertRaises(ValueError):
-            self.tc.decode('PhoneAll', self.phone2)
-        with self.assertRaises(ValueError):
-            self.tc.encode('PhoneOne', self.phone1)
-        with self.assertRaises(ValueError):
-            self.tc.decode('PhoneOne', self.phone1)
+        _must_raise(self, self.tc.encode, 'PhoneAll', self.phone2)
+        _must_raise(self, self.tc.decode, 'PhoneAll', self.phone2)
+        _must_raise(self, self.tc.encode, 'PhoneOne', self.phone1)
+        _must_raise(self, self.tc.decode, 'PhoneOne', self.phone1)
         self.assertEqual(self.tc.encode('PhoneOne', self.phone2), self.phone2)
         self.assertEqual(self.tc.decode('PhoneOne', self.phone2), self.phone2)
 
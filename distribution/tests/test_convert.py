@@ -6,9 +6,16 @@ import jadn
 import os
 import unittest
 
+from functools import lru_cache
+
 
 # TODO: Read and Write JIDL and HTML, Write Markdown, JSON Schema, XSD
 dir_path = os.path.abspath(os.path.dirname(__file__))
+info_path = os.path.join(dir_path, 'convert_info.jadn')
+types_path = os.path.join(dir_path, 'convert_types.jadn')
+jadn_schema_path = os.path.join(jadn.data_dir(), 'jadn_v1.1_schema.jadn')
+examples_path = os.path.join(dir_path, 'jadn-v1.0-examples.jadn')
+uni_path = os.path.join(dir_path, 'jadn-v1.0-examples-uni.jadn')
 quickstart_schema = {
     'types': [
         ['Person', 'Record', [],
@@ -19,6 +26,12 @@ quickstart_schema = {
     }
 
 
+@lru_cache(maxsize=None)
+def _schema(path: str) -> dict:     # Load and check each schema file once, converters only read the schema
+    with open(path) as fp:
+        return jadn.load(fp)
+
+
 class BasicConvert:
     def _convert(self, schema):
         raise NotImplemented(f'The unittest class `{self.__class__.__name__}` should implement _convert')
@@ -27,24 +40,19 @@ class BasicConvert:
         self._convert(jadn.check(quickstart_schema))
 
     def test_1_info(self):
-        with open(os.path.join(dir_path, 'convert_info.jadn')) as fp:
-            self._convert(jadn.load(fp))
+        self._convert(_schema(info_path))
 
     def test_2_types(self):
-        with open(os.path.join(dir_path, 'convert_types.jadn')) as fp:
-            self._convert(jadn.load(fp))
+        self._convert(_schema(types_path))
 
     def test_3_jadn(self):
-        with open(os.path.join(jadn.data_dir(), 'jadn_v1.1_schema.jadn')) as fp:
-            self._convert(jadn.load(fp))
+        self._convert(_schema(jadn_schema_path))
 
     def test_4_examples(self):
-        with open(os.path.join(dir_path, 'jadn-v1.0-examples.jadn')) as fp:
-            self._convert(jadn.load(fp))
+        self._convert(_schema(examples_path))
 
     def test_5_examples_uni(self):
-        with open(os.path.join(dir_path, 'jadn-v1.0-examples-uni.jadn')) as fp:
-            self._convert(jadn.load(fp))
+        self._convert(_schema(uni_path))
 
 class HtmlConvert(BasicConvert, unittest.TestCase):
     def _convert(self, schema):
@@ -9,19 +9,22 @@ import jadn
 from jadn.codec import Codec
 
 dir_path = os.path.abspath(os.path.dirname(__file__))
+jadn_schema_path = os.path.join(jadn.data_dir(), 'jadn_v1.1_schema.jadn')
+examples_path = os.path.join(dir_path, 'jadn-v1.0-examples.jadn')
+uni_path = os.path.join(dir_path, 'jadn-v1.0-examples-uni.jadn')
 
 
 class JADN(TestCase):
-    def setUp(self):
-        with open(os.path.join(jadn.data_dir(), 'jadn_v1.1_schema.jadn')) as fp:
-            self.schema = jadn.load(fp)
-        sa = jadn.analyze(self.schema)
+    @classmethod
+    def setUpClass(cls):    # Load, check and analyze the schema once
+        with open(jadn_schema_path) as fp:
+            cls.schema = jadn.load(fp)
+        sa = jadn.analyze(cls.schema)
         if sa['undefined']:
             print('Warning - undefined:', sa['undefined'])
-        self.tc = Codec(self.schema)
+        cls.tc = Codec(cls.schema, verbose_rec=True, verbose_str=True)
 
     def test_jadn_self(self):
-        self.tc.set_mode(verbose_rec=True, verbose_str=True)
         self.assertDictEqual(self.tc.encode('Schema', self.schema), self.schema)
         self.assertDictEqual(self.tc.decode('Schema', self.schema), self.schema)
 
@@ -47,6 +50,16 @@ class BadSchema(TestCase):
         ]
     }
 
+    schema_duplicate_fields = {
+        'types': [
+            ['Color', 'Map', [], '', [  # Duplicate field name red
+                [1, 'red', 'Integer', ['{0', '}255'], ''],
+                [2, 'green', 'Integer', ['{0', '}255'], ''],
+                [3, 'red', 'Integer', ['{0', '}255'], '']
+            ]]
+        ]
+    }
+
     def test_bad_item_fields(self):
         with self.assertRaises(ValueError):
             jadn.check(self.schema_bad_item_fields)
@@ -55,16 +68,21 @@ class BadSchema(TestCase):
         with self.assertRaises(ValueError):
             jadn.check(self.schema_bad_ordinal_fields)
 
+    def test_duplicate_fields(self):
+        with self.assertRaises(ValueError):
+            jadn.check(self.schema_duplicate_fields)
+
 
 class SpecExamples(TestCase):
     """
     Test Example messages contained in JADN spec
     """
 
-    def setUp(self):
-        with open(os.path.join(dir_path, 'jadn-v1.0-examples.jadn')) as fp:
-            self.schema = jadn.load(fp)
-        self.tc = Codec(self.schema, verbose_rec=True, verbose_str=True)
+    @classmethod
+    def setUpClass(cls):    # Load and check the schema once, tests do not change the codec mode
+        with open(examples_path) as fp:
+            cls.schema = jadn.load(fp)
+        cls.tc = Codec(cls.schema, verbose_rec=True, verbose_str=True)
 
     def test_choice_explicit(self):
         msg_intrinsic = {"quantity": 395, "product": {"software": "https://www.example.com/B902D1P0W37"}}
@@ -152,10 +170,10 @@ class SpecExamplesUniversity(TestCase):
     ]
 
     def test_university(self):
-        with open(os.path.join(dir_path, 'jadn-v1.0-examples-uni.jadn')) as fp:
+        with open(uni_path) as fp:
             self.schema = jadn.load(fp)
         self.tcv = Codec(self.schema, verbose_rec=True, verbose_str=True)
-        self.tcc = Codec(self.schema, verbose_rec=False, verbose_str=True)
+        self.tcc = self.tcv.with_mode(verbose_rec=False, verbose_str=True)
         uni_1 = self.tcv.decode("University", self.uni_verbose)
         uni_2 = self.tcc.decode("University", self.uni_compact)
         self.assertEqual(uni_1, uni_2)
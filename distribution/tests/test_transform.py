@@ -7,6 +7,15 @@ from unittest import main, TestCase
 import jadn
 from jadn.definitions import EXTENSIONS
 
+# Fixture schemas are class constants shared by several tests, so each one only needs to be checked once
+_SCHEMA_CHECKED = set()
+
+
+def _check_once(schema):
+    if id(schema) not in _SCHEMA_CHECKED:
+        jadn.check(schema)
+        _SCHEMA_CHECKED.add(id(schema))
+
 
 class Resolve(TestCase):
     schema = {}  # TODO: test Merge imported definitions
@@ -44,22 +53,26 @@ class StripComments(TestCase):
     }
 
     def test_strip_comments(self):
-        jadn.check(self.schema)
-        jadn.check(self.stripped_schema)
+        _check_once(self.schema)
+        _check_once(self.stripped_schema)
         ss = jadn.transform.strip_comments(self.schema)
         self.assertEqual(ss['types'], self.stripped_schema['types'])
 
     def test_truncate_comments(self):
-        jadn.check(self.schema)
-        jadn.check(self.trunc20_schema)
+        _check_once(self.schema)
+        _check_once(self.trunc20_schema)
         ss = jadn.transform.strip_comments(self.schema, width=20)
         self.assertEqual(ss['types'], self.trunc20_schema['types'])
 
 
 class UnfoldExtensions(TestCase):
+    @classmethod
+    def setUpClass(cls):    # Check all fixture schemas up front, tests only unfold and compare
+        for name, schema in vars(cls).items():
+            if name.startswith('schema_'):
+                _check_once(schema)
+
     def do_unfold_test(self, folded_schema, unfolded_schema, extensions=EXTENSIONS):
-        jadn.check(folded_schema)
-        jadn.check(unfolded_schema)
         us = jadn.transform.unfold_extensions(folded_schema, extensions)
         self.assertEqual(us['types'], unfolded_schema['types'])
 
@@ -439,14 +452,20 @@ class UnfoldExtensions(TestCase):
     }
 
     def test_derived_enum(self):
-        self.do_unfold_test(self.schema_enum1_folded, self.schema_enum1_unfolded, {'DerivedEnum'})
-        self.do_unfold_test(self.schema_enum2_folded, self.schema_enum2_unfolded, {'DerivedEnum'})
-        self.do_unfold_test(self.schema_enum3_folded, self.schema_enum3_unfolded, {'DerivedEnum'})
+        cases = ((self.schema_enum1_folded, self.schema_enum1_unfolded),
+                 (self.schema_enum2_folded, self.schema_enum2_unfolded),
+                 (self.schema_enum3_folded, self.schema_enum3_unfolded))
+        for n, (folded, unfolded) in enumerate(cases, 1):
+            with self.subTest(enum=n):      # Report each schema pair separately
+                self.do_unfold_test(folded, unfolded, {'DerivedEnum'})
 
     def test_derived_enum_all(self):
-        self.do_unfold_test(self.schema_enum1_folded, self.schema_enum1_unfolded_all)
-        self.do_unfold_test(self.schema_enum2_folded, self.schema_enum2_unfolded_all)
-        self.do_unfold_test(self.schema_enum3_folded, self.schema_enum3_unfolded_all)
+        cases = ((self.schema_enum1_folded, self.schema_enum1_unfolded_all),
+                 (self.schema_enum2_folded, self.schema_enum2_unfolded_all),
+                 (self.schema_enum3_folded, self.schema_enum3_unfolded_all))
+        for n, (folded, unfolded) in enumerate(cases, 1):
+            with self.subTest(enum=n):
+                self.do_unfold_test(folded, unfolded)
 
     """
     MapOf Enumerated Key Extension
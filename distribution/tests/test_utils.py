@@ -10,14 +10,14 @@ import jadn
 
 class Order(unittest.TestCase):
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):    # Tests only read the schemas and dependencies
         with open(os.path.join(jadn.data_dir(), 'jadn_v1.1_schema.jadn')) as fp:
-            self.schema1 = jadn.load(fp)
-        jadn.check(self.schema1)
-        self.schema2 = copy.deepcopy(self.schema1)
-        random.shuffle(self.schema2['types'])
-        self.deps1 = jadn.build_deps(self.schema1)
-        self.deps2 = jadn.build_deps(self.schema2)
+            cls.schema1 = jadn.load(fp)
+        cls.schema2 = {**cls.schema1, 'types': list(cls.schema1['types'])}    # Reorder, type definitions are shared
+        random.Random(1).shuffle(cls.schema2['types'])     # Fixed seed, same reordering on every run
+        cls.deps1 = jadn.build_deps(cls.schema1)
+        cls.deps2 = jadn.build_deps(cls.schema2)
 
     def test_adjacency(self):
         """
@@ -37,5 +37,31 @@ class Order(unittest.TestCase):
         self.assertEqual(names1, names2)
 
 
+class Canonical(unittest.TestCase):
+
+    def test_copy(self):
+        """
+        Canonical form strips default options without modifying the original schema
+        """
+        schema = {'info': {'package': 'http://example.com/canon'}, 'types': [
+            ['Name', 'String', ['{0', '}8'], '', []],
+            ['Rec', 'Record', [], '', [[1, 'a', 'Name', ['[1', ']1'], ''], [2, 'b', 'Number', ['y1', '[0'], '']]]]}
+        orig = copy.deepcopy(schema)
+        cs = jadn.canonicalize(schema)
+        self.assertEqual(schema, orig)
+        self.assertEqual(cs['types'][0][2], ['}8'])
+        self.assertEqual(cs['types'][1][4], [[1, 'a', 'Name', [], ''], [2, 'b', 'Number', ['y1.0', '[0'], '']])
+        cs['info']['package'] = 'http://example.com/other'
+        self.assertEqual(schema['info'], orig['info'])
+
+        opts, fopts = ['}5', '{0'], ['[0', 'y1']          # Type definitions built in Python may be tuples
+        schema = {'types': [('T', 'String', opts, '', []), ('R', 'Record', [], '', [(1, 'x', 'Number', fopts, '')])]}
+        cs = jadn.canonicalize(schema)
+        self.assertEqual(opts, ['}5', '{0'])
+        self.assertEqual(fopts, ['[0', 'y1'])
+        self.assertEqual(cs['types'][0][2], ['}5'])
+        self.assertEqual(cs['types'][1][4][0][3], ['y1.0', '[0'])
+
+
 if __name__ == '__main__':
     unittest.main()